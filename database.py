@@ -7,21 +7,97 @@ Provides unified interface for CSV compatibility and MongoDB operations
 import json
 import csv
 import logging
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import os
 
 try:
     from pymongo import MongoClient, ASCENDING, DESCENDING
-    from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+    from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError, BulkWriteError
+    from pymongo.write_concern import WriteConcern
     MONGODB_AVAILABLE = True
 except ImportError:
     MONGODB_AVAILABLE = False
     MongoClient = None
 
-from mongodb_schema import CRMDatabase, CONTACTS_COLLECTION, INTERACTIONS_COLLECTION, TASKS_COLLECTION
+from mongodb_schema import (CRMDatabase, CONTACTS_COLLECTION, INTERACTIONS_COLLECTION, TASKS_COLLECTION,
+                            EDIT_HISTORY_COLLECTION, STATS_COLLECTION)
+
+# Columns the CLI works with, in CSV order
+CSV_SHAPE_FIELDS = (
+    'external_row_id', 'phone_number', 'name', 'email', 'company', 'title', 'address',
+    'city', 'source', 'status', 'notes', 'last_call_at', 'callback_on', 'meeting_at',
+    'gcal_callback_event_id', 'gcal_meeting_event_id'
+)
+
+# Projection that returns contacts already in CSV_SHAPE_FIELDS shape
+CSV_SHAPE_PROJECTION = {
+    "_id": 0,
+    "external_row_id": {"$ifNull": ["$external_row_id", {"$toString": "$_id"}]},
+    "phone_number": {"$ifNull": ["$phone_number", ""]},
+    "name": {"$ifNull": ["$name", ""]},
+    "email": {"$ifNull": ["$email", ""]},
+    "company": {"$ifNull": ["$company", ""]},
+    "title": {"$ifNull": ["$title", ""]},
+    "address": {"$ifNull": ["$address", ""]},
+    "city": {"$ifNull": ["$city", ""]},
+    "source": {"$ifNull": ["$source", ""]},
+    "status": {"$ifNull": ["$status", "new"]},
+    "notes": {"$literal": ""},  # Populated from interactions if needed
+    "last_call_at": {"$literal": ""},
+    "callback_on": {"$ifNull": ["$callback_on", ""]},
+    "meeting_at": {"$ifNull": ["$meeting_at", ""]},
+    "gcal_callback_event_id": {"$literal": ""},
+    "gcal_meeting_event_id": {"$literal": ""}
+}
+
+# Fields CSV_SHAPE_PROJECTION blanks out but calendar events need: the calendar works on the
+# contact directly, and an outcome recorded there syncs notes back to the database
+CALENDAR_EVENT_FIELDS = ("notes", "last_call_at", "gcal_callback_event_id", "gcal_meeting_event_id")
+CALENDAR_EVENT_PROJECTION = {
+    **CSV_SHAPE_PROJECTION,
+    **{field: {"$ifNull": [f"${field}", ""]} for field in CALENDAR_EVENT_FIELDS}
+}
+
+# Server-side sort orders for the CLI priority views (1 = ascending). The today/overdue
+# views sort on DUE_SORT_FIELD, the effective due date added by _effective_due_stage
+DUE_SORT_FIELD = "_due_at"
+PRIORITY_VIEW_SORTS = {
+    "overdue": [(DUE_SORT_FIELD, 1)],  # Oldest (most overdue) first
+    "today": [(DUE_SORT_FIELD, 1)],  # Earliest first
+}
+NO_DUE_DATE = datetime(9999, 12, 31)  # Sorts contacts without a usable date last
+CALLBACK_HOUR = 10  # Callbacks have no time of day; the today view places them at 10:00
+DEFAULT_VIEW_SORT = [("company", 1)]
+
+# Case-insensitive ordering for name/company sorts
+VIEW_COLLATION = {"locale": "en", "strength": 2}
+
+# Contact fields with a unique index on MongoDB; bulk CSV inserts enforce the same
+UNIQUE_CONTACT_FIELDS = ("external_row_id", "phone_number")
+
+# Materialized dashboard counters (single document in STATS_COLLECTION)
+STATS_DOC_ID = "singleton"
+STATS_REFRESH_SECONDS = 300  # crm_stats older than this is recounted on read, correcting drift
+STATS_FIELDS = ("today", "overdue", "new", "clients", "cemetery", "recent", "total")
+STATUS_STAT_FIELDS = {"new": "new", "close_won": "clients", "close_lost": "cemetery"}
+# Only counters that change with a write are materialized; today/overdue/recent move with the
+# clock, so they are counted live on every read
+MATERIALIZED_STATS_FIELDS = ("new", "clients", "cemetery", "total")
+LIVE_STATS_FIELDS = tuple(field for field in STATS_FIELDS if field not in MATERIALIZED_STATS_FIELDS)
+RECENT_ACTIVITY_DAYS = 7  # Window for the "recent no-answer" dashboard count
+
+# database_config.json "connection_settings" keys -> MongoClient options
+CONNECTION_SETTING_OPTIONS = {
+    "max_pool_size": "maxPoolSize",
+    "min_pool_size": "minPoolSize",
+    "server_selection_timeout_ms": "serverSelectionTimeoutMS",
+    "connect_timeout_ms": "connectTimeoutMS",
+    "socket_timeout_ms": "socketTimeoutMS",
+}
 
 
 @dataclass
@@ -33,6 +109,7 @@ class DatabaseConfig:
     csv_backup_enabled: bool = True
     csv_export_path: str = "data_export.csv"
     auto_migrate: bool = True
+    connection_settings: Dict[str, Any] = field(default_factory=dict)
 
 
 class CRMDataManager:
@@ -59,7 +136,12 @@ class CRMDataManager:
             try:
                 self.mongodb = CRMDatabase(
                     connection_string=self.config.mongodb_uri,
-                    db_name=self.config.database_name
+                    db_name=self.config.database_name,
+                    client_options={
+                        CONNECTION_SETTING_OPTIONS[key]: value
+                        for key, value in self.config.connection_settings.items()
+                        if key in CONNECTION_SETTING_OPTIONS
+                    }
                 )
                 
                 if self.mongodb.connect():
@@ -94,6 +176,11 @@ class CRMDataManager:
                 self.csv_headers = list(reader.fieldnames) if reader.fieldnames else []
                 self.contacts_data = list(reader)
             
+            # Share one string object per status so repeated comparisons hit the identity fast path
+            for record in self.contacts_data:
+                if record.get("status"):
+                    record["status"] = sys.intern(record["status"])
+            
             self.logger.info(f"Loaded {len(self.contacts_data)} records from CSV")
             
             # If MongoDB is enabled and auto-migrate is true, migrate the data
@@ -129,15 +216,28 @@ class CRMDataManager:
                     limit: Optional[int] = None,
                     skip: Optional[int] = None,
                     sort_by: Optional[str] = "priority_score",
-                    sort_direction: int = -1) -> List[Dict]:
-        """Get contacts with optional filtering and sorting."""
+                    sort_direction: int = -1,
+                    csv_shape: bool = False,
+                    projection: Optional[Dict[str, int]] = None) -> List[Dict]:
+        """Get contacts with optional filtering and sorting.
+        
+        With csv_shape=True the records come back as CSV_SHAPE_FIELDS dicts.
+        Otherwise an inclusion projection (e.g. {"status": 1}) limits the fields returned.
+        """
         
         if self.config.use_mongodb and self.mongodb:
-            return self._get_contacts_mongodb(status_filter, limit, skip, sort_by, sort_direction)
-        else:
-            return self._get_contacts_csv(status_filter, limit, skip, sort_by, sort_direction)
+            return self._get_contacts_mongodb(status_filter, limit, skip, sort_by, sort_direction, csv_shape, projection)
+        
+        contacts = self._get_contacts_csv(status_filter, limit, skip, sort_by, sort_direction)
+        if csv_shape:
+            return [self._to_csv_shape(contact) for contact in contacts]
+        if projection:
+            fields = [field for field, include in projection.items() if include]
+            return [{field: contact[field] for field in fields if field in contact} for contact in contacts]
+        return contacts
     
-    def _get_contacts_mongodb(self, status_filter, limit, skip, sort_by, sort_direction) -> List[Dict]:
+    def _get_contacts_mongodb(self, status_filter, limit, skip, sort_by, sort_direction, csv_shape=False,
+                              projection=None) -> List[Dict]:
         """Get contacts from MongoDB."""
         try:
             collection = self.mongodb.db[CONTACTS_COLLECTION]
@@ -147,8 +247,19 @@ class CRMDataManager:
             if status_filter:
                 query["status"] = status_filter
             
+            if csv_shape:
+                pipeline = [{"$match": query}]
+                if sort_by:
+                    pipeline.append({"$sort": {sort_by: sort_direction}})
+                if skip:
+                    pipeline.append({"$skip": skip})
+                if limit:
+                    pipeline.append({"$limit": limit})
+                pipeline.append({"$project": CSV_SHAPE_PROJECTION})
+                return list(collection.aggregate(pipeline, batchSize=1000))
+            
             # Build cursor
-            cursor = collection.find(query)
+            cursor = collection.find(query, projection)
             
             # Add sorting
             if sort_by:
@@ -163,7 +274,8 @@ class CRMDataManager:
             # Convert ObjectIds to strings for JSON serialization
             contacts = []
             for doc in cursor:
-                doc["_id"] = str(doc["_id"])
+                if "_id" in doc:
+                    doc["_id"] = str(doc["_id"])
                 contacts.append(doc)
             
             return contacts
@@ -202,6 +314,28 @@ class CRMDataManager:
         
         return filtered_data
     
+    @staticmethod
+    def _to_csv_shape(contact: Dict) -> Dict:
+        """Build a CSV_SHAPE_FIELDS record (the CSV-backend twin of CSV_SHAPE_PROJECTION)."""
+        return {
+            'external_row_id': contact.get('external_row_id', str(contact.get('_id', ''))),
+            'phone_number': contact.get('phone_number', ''),
+            'name': contact.get('name', ''),
+            'email': contact.get('email', ''),
+            'company': contact.get('company', ''),
+            'title': contact.get('title', ''),
+            'address': contact.get('address', ''),
+            'city': contact.get('city', ''),
+            'source': contact.get('source', ''),
+            'status': contact.get('status', 'new'),
+            'notes': '',
+            'last_call_at': '',
+            'callback_on': contact.get('callback_on', ''),
+            'meeting_at': contact.get('meeting_at', ''),
+            'gcal_callback_event_id': '',
+            'gcal_meeting_event_id': ''
+        }
+    
     def get_contact_by_id(self, contact_id: str) -> Optional[Dict]:
         """Get a single contact by ID."""
         if self.config.use_mongodb and self.mongodb:
@@ -226,14 +360,30 @@ class CRMDataManager:
         """Get all contacts with a specific status (convenience method)."""
         return self.get_contacts(status_filter=status)
     
-    def add_contact(self, contact_data: Dict) -> bool:
-        """Add a new contact to the database."""
+    def count_contacts(self, status_filter: Optional[str] = None) -> int:
+        """Count contacts (optionally one status) without fetching them."""
+        if self.config.use_mongodb and self.mongodb:
+            try:
+                collection = self.mongodb.db[CONTACTS_COLLECTION]
+                if status_filter:
+                    return collection.count_documents({"status": status_filter})
+                return collection.estimated_document_count()
+            except Exception as e:
+                self.logger.error(f"Failed to count contacts in MongoDB: {e}")
+                return 0
+        
+        if status_filter:
+            return sum(1 for record in self.contacts_data if record.get("status") == status_filter)
+        return len(self.contacts_data)
+    
+    def add_contact(self, contact_data: Dict) -> Optional[str]:
+        """Add a new contact to the database. Returns the new contact's id, or None on failure."""
         if self.config.use_mongodb and self.mongodb:
             return self._add_contact_mongodb(contact_data)
         else:
             return self._add_contact_csv(contact_data)
     
-    def _add_contact_mongodb(self, contact_data: Dict) -> bool:
+    def _add_contact_mongodb(self, contact_data: Dict) -> Optional[str]:
         """Add contact to MongoDB."""
         try:
             collection = self.mongodb.db[CONTACTS_COLLECTION]
@@ -245,24 +395,33 @@ class CRMDataManager:
             # Ensure external_row_id is unique
             if collection.find_one({'external_row_id': contact_data['external_row_id']}):
                 self.logger.error(f"Contact with external_row_id {contact_data['external_row_id']} already exists")
-                return False
+                return None
             
             # Insert the contact
             result = collection.insert_one(contact_data)
             
             if result.inserted_id:
+                self._bump_stats(None, contact_data.get("status"), total=1)
                 self.logger.info(f"Contact {contact_data['name']} added successfully")
-                return True
+                return str(result.inserted_id)
             else:
                 self.logger.error("Failed to insert contact")
-                return False
+                return None
                 
         except Exception as e:
             self.logger.error(f"Failed to add contact to MongoDB: {e}")
-            return False
+            return None
     
-    def _add_contact_csv(self, contact_data: Dict) -> bool:
+    def _add_contact_csv(self, contact_data: Dict) -> Optional[str]:
         """Add contact to CSV file."""
+        if not self._append_contacts_csv([contact_data]):
+            return None
+        
+        self.logger.info(f"Contact {contact_data['name']} added to CSV successfully")
+        return contact_data['external_row_id']
+    
+    def _append_contacts_csv(self, contacts: List[Dict]) -> bool:
+        """Append contacts to the CSV export file, writing the header if the file is new."""
         try:
             # For CSV, we need to append to the file
             csv_path = Path(self.config.csv_export_path)
@@ -275,13 +434,15 @@ class CRMDataManager:
             ]
             
             # Add timestamps
-            contact_data['created_at'] = datetime.now().isoformat()
-            contact_data['updated_at'] = datetime.now().isoformat()
-            
-            # Fill missing fields with empty strings
-            for header in expected_headers:
-                if header not in contact_data:
-                    contact_data[header] = ''
+            now = datetime.now().isoformat()
+            for contact_data in contacts:
+                contact_data['created_at'] = now
+                contact_data['updated_at'] = now
+                
+                # Fill missing fields with empty strings
+                for header in expected_headers:
+                    if header not in contact_data:
+                        contact_data[header] = ''
             
             # Check if file exists and create with headers if not
             write_header = not csv_path.exists()
@@ -292,15 +453,95 @@ class CRMDataManager:
                 if write_header:
                     writer.writeheader()
                 
-                writer.writerow({k: contact_data.get(k, '') for k in expected_headers})
+                writer.writerows({k: contact_data.get(k, '') for k in expected_headers} for contact_data in contacts)
             
-            self.logger.info(f"Contact {contact_data['name']} added to CSV successfully")
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to add contact to CSV: {e}")
             return False
     
+    def add_contacts_bulk(self, contacts: List[Dict]) -> int:
+        """Add several contacts in one write. Returns how many were stored."""
+        if not contacts:
+            return 0
+        
+        if self.config.use_mongodb and self.mongodb:
+            return self._add_contacts_bulk_mongodb(contacts)
+        else:
+            return self._add_contacts_bulk_csv(contacts)
+    
+    def _add_contacts_bulk_mongodb(self, contacts: List[Dict]) -> int:
+        """Insert contacts into MongoDB with a single unordered insert_many."""
+        now = datetime.now()
+        for contact_data in contacts:
+            contact_data['created_at'] = now
+            contact_data['updated_at'] = now
+        
+        # Unordered: a duplicate external_row_id/phone only skips that contact.
+        # No multi-document transaction, as standalone servers don't support them.
+        failed = set()
+        try:
+            self.mongodb.db[CONTACTS_COLLECTION].insert_many(contacts, ordered=False)
+        except BulkWriteError as e:
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+            self.logger.error(f"{len(failed)} of {len(contacts)} contacts were rejected: {e.details.get('writeErrors', [])[:3]}")
+        except Exception as e:
+            self.logger.error(f"Failed to add contacts to MongoDB: {e}")
+            return 0
+        
+        inserted = [contact for i, contact in enumerate(contacts) if i not in failed]
+        
+        # One $inc for the whole batch
+        increments = {"total": len(inserted)}
+        for contact_data in inserted:
+            field = STATUS_STAT_FIELDS.get(contact_data.get("status"))
+            if field:
+                increments[field] = increments.get(field, 0) + 1
+        self._inc_stats(increments)
+        
+        self.logger.info(f"Added {len(inserted)} contacts in bulk")
+        return len(inserted)
+    
+    def _add_contacts_bulk_csv(self, contacts: List[Dict]) -> int:
+        """Append contacts to the CSV file in one write.
+        
+        Like the unique indexes on MongoDB, a contact whose external_row_id or phone number
+        is already stored (or earlier in the batch) is skipped; the rest are still written.
+        """
+        seen = {field: set() for field in UNIQUE_CONTACT_FIELDS}
+        existing = list(self.contacts_data)
+        export_path = Path(self.config.csv_export_path)
+        if export_path.exists():
+            try:
+                with open(export_path, 'r', newline='', encoding='utf-8') as f:
+                    existing.extend(csv.DictReader(f))
+            except Exception as e:
+                self.logger.error(f"Failed to read {export_path} for duplicate checks: {e}")
+                return 0
+        for record in existing:
+            for field in UNIQUE_CONTACT_FIELDS:
+                if record.get(field):
+                    seen[field].add(record[field])
+        
+        accepted = []
+        rejected = []
+        for contact_data in contacts:
+            if any(contact_data.get(field) and contact_data[field] in seen[field] for field in UNIQUE_CONTACT_FIELDS):
+                rejected.append(contact_data.get('external_row_id') or contact_data.get('phone_number'))
+                continue
+            for field in UNIQUE_CONTACT_FIELDS:
+                if contact_data.get(field):
+                    seen[field].add(contact_data[field])
+            accepted.append(contact_data)
+        
+        if rejected:
+            self.logger.error(f"{len(rejected)} of {len(contacts)} contacts were rejected as duplicates: {rejected[:3]}")
+        if not accepted:
+            return 0
+        
+        return len(accepted) if self._append_contacts_csv(accepted) else 0
+    
     def update_contact(self, contact_id: str, updates: Dict) -> bool:
         """Update a contact record."""
         if self.config.use_mongodb and self.mongodb:
@@ -320,27 +561,31 @@ class CRMDataManager:
             if len(contact_id) == 24:
                 try:
                     from bson import ObjectId
-                    result = collection.update_one(
-                        {"_id": ObjectId(contact_id)},
-                        {"$set": updates}
-                    )
-                    if result.modified_count > 0:
+                    if self._apply_contact_update(collection, {"_id": ObjectId(contact_id)}, updates):
                         return True
                 except:
                     pass  # Fall through to external_row_id search
             
             # Try to find by external_row_id
-            result = collection.update_one(
-                {"external_row_id": contact_id},
-                {"$set": updates}
-            )
-            
-            return result.modified_count > 0
+            return self._apply_contact_update(collection, {"external_row_id": contact_id}, updates)
             
         except Exception as e:
             self.logger.error(f"Failed to update contact in MongoDB: {e}")
             return False
     
+    def _apply_contact_update(self, collection, query: Dict, updates: Dict) -> bool:
+        """Apply $set updates to one contact, keeping the status counters in crm_stats current."""
+        if "status" not in updates:
+            return collection.update_one(query, {"$set": updates}).modified_count > 0
+        
+        # Fetch the previous status in the same round-trip as the update
+        before = collection.find_one_and_update(query, {"$set": updates}, projection={"status": 1})
+        if before is None:
+            return False
+        
+        self._bump_stats(before.get("status"), updates["status"])
+        return True
+    
     def _update_contact_csv(self, contact_id: str, updates: Dict) -> bool:
         """Update contact in CSV data."""
         try:
@@ -404,6 +649,24 @@ class CRMDataManager:
             
             return None
     
+    def insert_edit_history(self, entries: List[Dict], acknowledged: bool = False) -> bool:
+        """Write edit history entries.
+        
+        Writes are unacknowledged (w=0) by default since the history is an audit
+        trail; pass acknowledged=True when the entries must be readable right away.
+        """
+        if not (self.config.use_mongodb and self.mongodb) or not entries:
+            return False
+        
+        try:
+            write_concern = WriteConcern(w=1) if acknowledged else WriteConcern(w=0)
+            collection = self.mongodb.db.get_collection(EDIT_HISTORY_COLLECTION, write_concern=write_concern)
+            collection.insert_many(entries, ordered=False)
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to write edit history: {e}")
+            return False
+    
     def create_task(self, contact_id: str, task_data: Dict) -> Optional[str]:
         """Create a task record."""
         if self.config.use_mongodb and self.mongodb:
@@ -445,75 +708,72 @@ class CRMDataManager:
             
             return None
     
-    def get_priority_view_data(self, view_type: str = "today") -> List[Dict]:
-        """Get data for priority views (today, due, overdue, hot, new)."""
+    def get_status_view_data(self, status_filter: Optional[str] = None, sort_spec: Optional[List] = None,
+                             csv_shape: bool = False) -> List[Dict]:
+        """Get contacts (optionally one status) for the all/clients/cemetery views.
+        
+        When sort_spec is given (MongoDB only), documents are sorted on the server with
+        VIEW_COLLATION, like the priority views.
+        """
         if self.config.use_mongodb and self.mongodb:
-            return self._get_priority_view_mongodb(view_type)
-        else:
-            return self._get_priority_view_csv(view_type)
+            try:
+                query = {"status": status_filter} if status_filter else {}
+                return self._run_view_pipeline(self.mongodb.db[CONTACTS_COLLECTION], [{"$match": query}],
+                                               sort_spec, csv_shape)
+            except Exception as e:
+                self.logger.error(f"Failed to get contacts from MongoDB: {e}")
+                return []
+        
+        return self.get_contacts(status_filter=status_filter, csv_shape=csv_shape)
+    
+    def get_priority_view_data(self, view_type: str = "today", sort_spec: Optional[List] = None,
+                               csv_shape: bool = False) -> List[Dict]:
+        """Get data for priority views (today, due, overdue, hot, new).
+        
+        When sort_spec is given (MongoDB only), documents are sorted on the
+        server. With csv_shape=True the records come back as CSV_SHAPE_FIELDS dicts.
+        """
+        if self.config.use_mongodb and self.mongodb:
+            return self._get_priority_view_mongodb(view_type, sort_spec, csv_shape)
+        
+        contacts = self._get_priority_view_csv(view_type)
+        return [self._to_csv_shape(contact) for contact in contacts] if csv_shape else contacts
     
-    def _get_priority_view_mongodb(self, view_type: str) -> List[Dict]:
+    def _get_priority_view_mongodb(self, view_type: str, sort_spec: Optional[List] = None,
+                                   csv_shape: bool = False) -> List[Dict]:
         """Get priority view data from MongoDB."""
         try:
             contacts_coll = self.mongodb.db[CONTACTS_COLLECTION]
             tasks_coll = self.mongodb.db[TASKS_COLLECTION]
             
-            today = datetime.utcnow().date()
-            
             if view_type == "today":
                 # Find contacts with tasks due today
-                pipeline = [
-                    {
-                        "$lookup": {
-                            "from": TASKS_COLLECTION,
-                            "localField": "_id",
-                            "foreignField": "contact_id",
-                            "as": "tasks"
-                        }
-                    },
-                    {
-                        "$match": {
-                            "tasks.due_at": {
-                                "$gte": datetime.combine(today, datetime.min.time()),
-                                "$lt": datetime.combine(today + timedelta(days=1), datetime.min.time())
-                            }
-                        }
-                    }
-                ]
-                
-                contacts = list(contacts_coll.aggregate(pipeline))
+                pipeline = self._due_tasks_stages("today") + [self._effective_due_stage("today")]
+                contacts = self._run_view_pipeline(contacts_coll, pipeline, sort_spec, csv_shape)
                 
             elif view_type == "overdue":
-                pipeline = [
-                    {
-                        "$lookup": {
-                            "from": TASKS_COLLECTION,
-                            "localField": "_id",
-                            "foreignField": "contact_id",
-                            "as": "tasks"
-                        }
-                    },
-                    {
-                        "$match": {
-                            "tasks.due_at": {
-                                "$lt": datetime.combine(today, datetime.min.time())
-                            },
-                            "tasks.state": "pending"
-                        }
-                    }
-                ]
-                
-                contacts = list(contacts_coll.aggregate(pipeline))
+                pipeline = self._due_tasks_stages("overdue") + [self._effective_due_stage("overdue")]
+                contacts = self._run_view_pipeline(contacts_coll, pipeline, sort_spec, csv_shape)
                 
             elif view_type == "new":
-                contacts = list(contacts_coll.find({"status": "new"}).sort("metadata.created_at", -1))
+                pipeline = [{"$match": {"status": "new"}}]
+                if not sort_spec:
+                    pipeline.append({"$sort": {"metadata.created_at": -1}})
+                contacts = self._run_view_pipeline(contacts_coll, pipeline, sort_spec, csv_shape)
                 
             else:  # Default to all active contacts
-                contacts = list(contacts_coll.find({"status": {"$ne": "archived"}}).sort("priority_score", -1))
+                pipeline = [{"$match": {"status": {"$ne": "archived"}}}]
+                if not sort_spec:
+                    pipeline.append({"$sort": {"priority_score": -1}})
+                contacts = self._run_view_pipeline(contacts_coll, pipeline, sort_spec, csv_shape)
+            
+            if csv_shape:
+                return contacts
             
             # Convert ObjectIds to strings
             for contact in contacts:
                 contact["_id"] = str(contact["_id"])
+                contact.pop(DUE_SORT_FIELD, None)
                 if "tasks" in contact:
                     for task in contact["tasks"]:
                         task["_id"] = str(task["_id"])
@@ -525,6 +785,84 @@ class CRMDataManager:
             self.logger.error(f"Failed to get priority view from MongoDB: {e}")
             return []
     
+    def _due_task_query(self, view_type: str) -> Dict:
+        """TASKS_COLLECTION query for tasks due today, or pending and overdue."""
+        today = datetime.utcnow().date()
+        start_of_today = datetime.combine(today, datetime.min.time())
+        
+        if view_type == "today":
+            return {
+                "due_at": {
+                    "$gte": start_of_today,
+                    "$lt": start_of_today + timedelta(days=1)
+                }
+            }
+        
+        # "overdue"
+        return {
+            "due_at": {"$lt": start_of_today},
+            "state": "pending"
+        }
+    
+    def _due_tasks_stages(self, view_type: str) -> List[Dict]:
+        """Pipeline stages matching contacts with tasks due today or pending and overdue."""
+        task_match = {f"tasks.{field}": condition for field, condition in self._due_task_query(view_type).items()}
+        
+        return [
+            {
+                "$lookup": {
+                    "from": TASKS_COLLECTION,
+                    "localField": "_id",
+                    "foreignField": "contact_id",
+                    "as": "tasks"
+                }
+            },
+            {"$match": task_match}
+        ]
+    
+    def _effective_due_stage(self, view_type: str) -> Dict:
+        """$addFields stage setting DUE_SORT_FIELD to the date a today/overdue contact sorts by.
+        
+        Mirrors the CLI's Python ordering: overdue contacts sort by their earliest callback or
+        meeting date (most days overdue first); today's contacts by their earliest time today,
+        with callbacks at CALLBACK_HOUR. Missing, empty or unparseable dates are ignored by $min
+        and contacts with none sort last.
+        """
+        dates = {
+            field: {"$convert": {"input": f"${field}", "to": "date", "onError": None, "onNull": None}}
+            for field in ("callback_on", "meeting_at")
+        }
+        
+        if view_type == "today":
+            start_of_today = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+            
+            def is_today(expr):
+                return {"$and": [{"$gte": [expr, start_of_today]},
+                                 {"$lt": [expr, start_of_today + timedelta(days=1)]}]}
+            
+            candidates = [
+                {"$cond": [is_today(dates["callback_on"]), start_of_today + timedelta(hours=CALLBACK_HOUR), None]},
+                {"$cond": [is_today(dates["meeting_at"]), dates["meeting_at"], None]},
+            ]
+        else:  # "overdue"
+            candidates = [dates["callback_on"], dates["meeting_at"]]
+        
+        return {"$addFields": {DUE_SORT_FIELD: {"$ifNull": [{"$min": candidates}, NO_DUE_DATE]}}}
+    
+    def _run_view_pipeline(self, collection, pipeline: List[Dict], sort_spec: Optional[List] = None,
+                           csv_shape: bool = False) -> List[Dict]:
+        """Run a view aggregation, adding the optional sort and CSV-shape projection stages."""
+        stages = list(pipeline)
+        options = {"batchSize": 1000}
+        
+        if sort_spec:
+            stages.append({"$sort": dict(sort_spec)})
+            options["collation"] = VIEW_COLLATION
+        if csv_shape:
+            stages.append({"$project": CSV_SHAPE_PROJECTION})
+        
+        return list(collection.aggregate(stages, **options))
+    
     def _get_priority_view_csv(self, view_type: str) -> List[Dict]:
         """Get priority view data from CSV."""
         today = datetime.now().date()
@@ -587,6 +925,177 @@ class CRMDataManager:
         else:  # All active
             return [record for record in self.contacts_data if record.get("status") not in ["archived", "deleted", "do_not_call"]]
     
+    def get_events_in_range(self, start: datetime, end: datetime) -> List[Dict]:
+        """Get contacts (CSV shape, keeping notes/last call/gcal ids) with a callback or meeting in [start, end)."""
+        if self.config.use_mongodb and self.mongodb:
+            try:
+                # Dates may be stored as ISO strings or BSON dates; each clause only matches its own type
+                start_str, end_str = start.date().isoformat(), end.date().isoformat()
+                query = {"$or": [
+                    {field: bounds}
+                    for field in ("callback_on", "meeting_at")
+                    for bounds in ({"$gte": start_str, "$lt": end_str}, {"$gte": start, "$lt": end})
+                ]}
+                
+                pipeline = [{"$match": query}, {"$project": CALENDAR_EVENT_PROJECTION}]
+                return list(self.mongodb.db[CONTACTS_COLLECTION].aggregate(pipeline))
+                
+            except Exception as e:
+                self.logger.error(f"Failed to get events from MongoDB: {e}")
+                return []
+        
+        events = []
+        for record in self.contacts_data:
+            for field in ("callback_on", "meeting_at"):
+                value = record.get(field)
+                if not value:
+                    continue
+                try:
+                    # "...Z"/"+00:00" values parse tz-aware; compare them as naive like start/end
+                    when = datetime.fromisoformat(value.replace("Z", "+00:00")).replace(tzinfo=None)
+                    if start <= when < end:
+                        event = self._to_csv_shape(record)
+                        event.update({field: record.get(field, '') for field in CALENDAR_EVENT_FIELDS})
+                        events.append(event)
+                        break
+                except (ValueError, TypeError):
+                    pass
+        
+        return events
+    
+    def get_crm_stats(self) -> Optional[Dict[str, int]]:
+        """Get dashboard counts (MongoDB only).
+        
+        Status counters come from the materialized crm_stats document, recounted when it is
+        missing or older than STATS_REFRESH_SECONDS (writers that bypass _inc_stats, such as
+        imports, are corrected then). The date-dependent counts (LIVE_STATS_FIELDS) are
+        index-backed counts computed now, so they never lag behind the clock.
+        """
+        if not (self.config.use_mongodb and self.mongodb):
+            return None
+        
+        try:
+            doc = self.mongodb.db[STATS_COLLECTION].find_one({"_id": STATS_DOC_ID})
+            last_refresh = doc.get("last_refresh") if doc else None
+            if not last_refresh or datetime.utcnow() - last_refresh > timedelta(seconds=STATS_REFRESH_SECONDS):
+                doc = self.refresh_crm_stats()
+            
+            stats = {field: max(int(doc.get(field, 0)), 0) for field in MATERIALIZED_STATS_FIELDS}
+            stats.update(self.get_stats_counts(LIVE_STATS_FIELDS))
+            return {field: stats[field] for field in STATS_FIELDS}
+            
+        except Exception as e:
+            self.logger.error(f"Failed to read CRM stats: {e}")
+            return None
+    
+    def refresh_crm_stats(self) -> Dict:
+        """Recompute the materialized counters from scratch and store them in crm_stats."""
+        stats = self.get_stats_counts(MATERIALIZED_STATS_FIELDS)
+        stats["last_refresh"] = datetime.utcnow()
+        
+        self.mongodb.db[STATS_COLLECTION].replace_one({"_id": STATS_DOC_ID}, stats, upsert=True)
+        return stats
+    
+    def get_stats_counts(self, fields: Tuple[str, ...] = STATS_FIELDS) -> Dict[str, int]:
+        """Count the given dashboard categories (default: all STATS_FIELDS).
+        
+        On MongoDB each category is a separate index-backed count rather than a
+        collection scan, so only the matching contacts or tasks are touched.
+        """
+        if not (self.config.use_mongodb and self.mongodb):
+            counts = self._get_stats_counts_csv()
+            return {field: counts[field] for field in fields}
+        
+        contacts = self.mongodb.db[CONTACTS_COLLECTION]
+        counters = {
+            "today": lambda: self._count_contacts_with_due_tasks("today"),
+            "overdue": lambda: self._count_contacts_with_due_tasks("overdue"),
+            "new": lambda: contacts.count_documents({"status": "new"}),
+            "clients": lambda: contacts.count_documents({"status": "close_won"}),
+            "cemetery": lambda: contacts.count_documents({"status": "close_lost"}),
+            "recent": self.count_recent_no_answer,
+            "total": contacts.estimated_document_count,
+        }
+        
+        return {field: counters[field]() for field in fields}
+    
+    def _count_contacts_with_due_tasks(self, view_type: str) -> int:
+        """Count contacts with tasks due today or pending and overdue, via the tasks due_at indexes."""
+        return len(self.mongodb.db[TASKS_COLLECTION].distinct("contact_id", self._due_task_query(view_type)))
+    
+    def count_recent_no_answer(self, days: int = RECENT_ACTIVITY_DAYS) -> int:
+        """Count contacts whose last call in the past `days` days went unanswered."""
+        if self.config.use_mongodb and self.mongodb:
+            try:
+                return self.mongodb.db[CONTACTS_COLLECTION].count_documents(self._recent_no_answer_query(days))
+            except Exception as e:
+                self.logger.error(f"Failed to count recent no-answer contacts: {e}")
+                return 0
+        
+        cutoff = datetime.now() - timedelta(days=days)
+        recent = 0
+        for record in self.contacts_data:
+            if record.get("status") == "no_answer" and record.get("last_call_at"):
+                try:
+                    last_call = datetime.fromisoformat(record["last_call_at"].replace("Z", "+00:00"))
+                    if last_call.replace(tzinfo=None) >= cutoff:
+                        recent += 1
+                except (ValueError, TypeError, AttributeError):
+                    pass
+        
+        return recent
+    
+    @staticmethod
+    def _recent_no_answer_query(days: int) -> Dict:
+        """Query for no-answer contacts called since `days` ago.
+        
+        last_call_at may be an ISO string (compared lexicographically) or a BSON date;
+        each clause only matches its own type.
+        """
+        cutoff = datetime.now() - timedelta(days=days)
+        return {"status": "no_answer", "$or": [
+            {"last_call_at": {"$gte": cutoff.isoformat()}},
+            {"last_call_at": {"$gte": cutoff}},
+        ]}
+    
+    def _get_stats_counts_csv(self) -> Dict[str, int]:
+        """Count dashboard categories over the in-memory CSV data."""
+        statuses = [record.get("status") for record in self.contacts_data]
+        
+        return {
+            "today": len(self._get_priority_view_csv("today")),
+            "overdue": len(self._get_priority_view_csv("overdue")),
+            "new": statuses.count("new"),
+            "clients": statuses.count("close_won"),
+            "cemetery": statuses.count("close_lost"),
+            "recent": self.count_recent_no_answer(),
+            "total": len(self.contacts_data)
+        }
+    
+    def _bump_stats(self, old_status: Optional[str], new_status: Optional[str], total: int = 0):
+        """Apply a status transition to the crm_stats counters with a single $inc."""
+        increments = {}
+        if old_status != new_status:
+            if old_status in STATUS_STAT_FIELDS:
+                increments[STATUS_STAT_FIELDS[old_status]] = -1
+            if new_status in STATUS_STAT_FIELDS:
+                increments[STATUS_STAT_FIELDS[new_status]] = 1
+        if total:
+            increments["total"] = total
+        
+        self._inc_stats(increments)
+    
+    def _inc_stats(self, increments: Dict[str, int]):
+        """Apply counter increments to the crm_stats document."""
+        increments = {field: n for field, n in increments.items() if n}
+        if not increments:
+            return
+        
+        try:
+            self.mongodb.db[STATS_COLLECTION].update_one({"_id": STATS_DOC_ID}, {"$inc": increments})
+        except Exception as e:
+            self.logger.error(f"Failed to update CRM stats: {e}")
+    
     def export_to_csv(self, export_path: Optional[str] = None) -> bool:
         """Export current data to CSV format."""
         export_file = Path(export_path or self.config.csv_export_path)
@@ -683,6 +1192,17 @@ class CRMDataManager:
             self.mongodb.disconnect()
 
 
+def apply_config_settings(config: DatabaseConfig, settings: Dict[str, Any]) -> DatabaseConfig:
+    """Apply database_config.json-style settings on top of a DatabaseConfig."""
+    config.use_mongodb = settings.get("use_mongodb", config.use_mongodb)
+    config.mongodb_uri = settings.get("mongodb_uri", config.mongodb_uri)
+    config.database_name = settings.get("database_name", config.database_name)
+    config.csv_backup_enabled = settings.get("csv_backup_enabled", config.csv_backup_enabled)
+    config.auto_migrate = settings.get("auto_migrate", config.auto_migrate)
+    config.connection_settings = settings.get("connection_settings", config.connection_settings)
+    return config
+
+
 def load_database_config() -> DatabaseConfig:
     """Load database configuration from environment and config files."""
     config = DatabaseConfig()
@@ -698,20 +1218,16 @@ def load_database_config() -> DatabaseConfig:
         config.database_name = os.getenv("DATABASE_NAME")
     
     # Check for config file
-    config_file = Path("database_config.json")
-    if config_file.exists():
-        try:
-            with open(config_file) as f:
-                file_config = json.load(f)
-            
-            config.use_mongodb = file_config.get("use_mongodb", config.use_mongodb)
-            config.mongodb_uri = file_config.get("mongodb_uri", config.mongodb_uri)
-            config.database_name = file_config.get("database_name", config.database_name)
-            config.csv_backup_enabled = file_config.get("csv_backup_enabled", config.csv_backup_enabled)
-            config.auto_migrate = file_config.get("auto_migrate", config.auto_migrate)
-            
-        except Exception as e:
-            logging.getLogger(__name__).error(f"Failed to load database config: {e}")
+    try:
+        with open("database_config.json") as f:
+            file_config = json.load(f)
+        
+        apply_config_settings(config, file_config)
+        
+    except FileNotFoundError:
+        pass  # No config file: keep defaults and environment settings
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Failed to load database config: {e}")
     
     return config
 
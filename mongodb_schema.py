@@ -22,6 +22,18 @@ CALENDAR_MAP_COLLECTION = "calendar_map"
 PRIORITY_RULES_COLLECTION = "priority_rules"
 USER_PREFS_COLLECTION = "user_preferences"
 AUDIT_COLLECTION = "audit_log"
+EDIT_HISTORY_COLLECTION = "edit_history"
+STATS_COLLECTION = "crm_stats"
+
+# Contact date fields that can be stored as native BSON dates
+CONTACT_DATE_FIELDS = ("callback_on", "meeting_at", "last_call_at")
+
+# Connection pool defaults for the shared MongoClient
+DEFAULT_CLIENT_OPTIONS = {
+    "maxPoolSize": 10,
+    "minPoolSize": 2,
+    "serverSelectionTimeoutMS": 2000,
+}
 
 class MongoDBSchema:
     """MongoDB schema manager for VStudio CLI CRM."""
@@ -195,28 +207,34 @@ class MongoDBSchema:
 class CRMDatabase:
     """MongoDB CRM database manager."""
     
-    def __init__(self, connection_string: str = "mongodb://localhost:27017/", db_name: str = "vstudio_crm"):
+    def __init__(self, connection_string: str = "mongodb://localhost:27017/", db_name: str = "vstudio_crm",
+                 client_options: Optional[Dict[str, Any]] = None):
         self.connection_string = connection_string
         self.db_name = db_name
+        self.client_options = {**DEFAULT_CLIENT_OPTIONS, **(client_options or {})}
         self.client = None
         self.db = None
         
     def connect(self) -> bool:
-        """Connect to MongoDB."""
+        """Connect to MongoDB (the client and its connection pool are reused for the session)."""
         try:
-            self.client = MongoClient(self.connection_string)
+            if self.client is None:
+                self.client = MongoClient(self.connection_string, **self.client_options)
             self.db = self.client[self.db_name]
             # Test connection
             self.client.admin.command('ping')
             return True
         except Exception as e:
             print(f"Failed to connect to MongoDB: {e}")
+            self.disconnect()
             return False
     
     def disconnect(self):
         """Disconnect from MongoDB."""
         if self.client:
             self.client.close()
+            self.client = None
+            self.db = None
     
     def create_indexes(self):
         """Create database indexes for optimal performance."""
@@ -230,6 +248,12 @@ class CRMDatabase:
         contacts.create_index("email", sparse=True)
         contacts.create_index([("name", ASCENDING), ("company", ASCENDING)])
         contacts.create_index("status")
+        # Superseded: the today/overdue views sort on a computed due date this index cannot serve
+        if "status_1_callback_on_1_meeting_at_1" in contacts.index_information():
+            contacts.drop_index("status_1_callback_on_1_meeting_at_1")
+        contacts.create_index("callback_on", sparse=True)  # Calendar range $match (get_events_in_range)
+        contacts.create_index("meeting_at", sparse=True)
+        contacts.create_index([("status", ASCENDING), ("last_call_at", DESCENDING)])  # Recent no-answer count
         contacts.create_index([("priority_score", DESCENDING)])
         contacts.create_index("metadata.last_contact_at")
         contacts.create_index("tags")
@@ -278,6 +302,10 @@ class CRMDatabase:
         audit.create_index("timestamp")
         audit.create_index("user_id")
         
+        # Edit history indexes (newest-first per contact, matching the history view)
+        edit_history = self.db[EDIT_HISTORY_COLLECTION]
+        edit_history.create_index([("contact_id", ASCENDING), ("timestamp", DESCENDING)])
+        
         print("Database indexes created successfully")
     
     def migrate_from_csv(self, csv_data: List[Dict]) -> Dict[str, int]:
@@ -475,6 +503,22 @@ class CRMDatabase:
         
         return task_count
     
+    def migrate_contact_dates(self) -> Dict[str, int]:
+        """Convert ISO-string contact dates to BSON dates. Returns modified counts per field."""
+        if self.db is None:
+            raise RuntimeError("Database not connected")
+        
+        contacts = self.db[CONTACTS_COLLECTION]
+        modified = {}
+        for field in CONTACT_DATE_FIELDS:
+            result = contacts.update_many(
+                {field: {"$type": "string", "$ne": ""}},
+                [{"$set": {field: {"$toDate": f"${field}"}}}]
+            )
+            modified[field] = result.modified_count
+        
+        return modified
+    
     def setup_default_priority_rules(self):
         """Set up default priority scoring rules."""
         if self.db is None:
@@ -120,6 +120,29 @@ class MongoDBSetup:
             logger.error(f"✗ Failed to create database structure: {e}")
             return False
     
+    def migrate_contact_dates(self) -> bool:
+        """Convert ISO-string contact dates to native BSON dates."""
+        try:
+            logger.info("Converting contact dates to BSON dates...")
+            
+            from mongodb_schema import CRMDatabase
+            
+            db_manager = CRMDatabase(self.mongodb_uri, self.database_name)
+            
+            if not db_manager.connect():
+                logger.error("Failed to connect to MongoDB")
+                return False
+            
+            for field, count in db_manager.migrate_contact_dates().items():
+                logger.info(f"✓ {field}: {count} contacts converted")
+            
+            db_manager.disconnect()
+            return True
+            
+        except Exception as e:
+            logger.error(f"✗ Failed to convert contact dates: {e}")
+            return False
+    
     def migrate_csv_data(self, csv_path: Path) -> bool:
         """Migrate existing CSV data to MongoDB."""
         try:
@@ -260,6 +283,8 @@ def main():
                        help="Database name (default: vstudio_crm)")
     parser.add_argument("--check-only", action="store_true",
                        help="Only check MongoDB installation, don't setup")
+    parser.add_argument("--migrate-dates", action="store_true",
+                       help="Convert ISO-string callback/meeting/last call dates to BSON dates")
     
     args = parser.parse_args()
     
@@ -277,6 +302,9 @@ def main():
             setup.install_mongodb_instructions()
             sys.exit(1)
     
+    if args.migrate_dates:
+        sys.exit(0 if setup.migrate_contact_dates() else 1)
+    
     # Run full setup
     if setup.run_setup(args.csv):
         logger.info("Setup completed successfully!")
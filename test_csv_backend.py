@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Test the CSV backend: edit journal write/replay/compaction, bulk contact inserts with
+duplicates, calendar event ranges, and date parsing for mixed string/BSON date fields
+"""
+
+import atexit
+import csv
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import vstudio_cli
+from vstudio_cli import VStudioCLI, _to_datetime, STATUS_CALLBACK
+from database import CRMDataManager, DatabaseConfig
+
+FIELDS = ['external_row_id', 'phone_number', 'name', 'company']
+ROWS = [
+    {'external_row_id': f'row_{i}', 'phone_number': f'+1647555{i:04d}', 'name': f'Contact {i}', 'company': 'Acme'}
+    for i in range(20)
+]
+
+
+def _write_csv(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _load_app(csv_path):
+    """Open a session on csv_path that ends like a crash: no exit-time flush of the journal."""
+    app = VStudioCLI(debug=False)
+    atexit.unregister(app._flush_all)
+    app.csv_path = Path(csv_path)
+    app._load_csv()
+    return app
+
+
+def test_journal_write_and_replay():
+    """An edit journaled in one session is replayed onto the same contact in the next."""
+
+    print("🧪 CSV BACKEND TEST")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / 'contacts.csv'
+        _write_csv(csv_path, ROWS)
+
+        app = _load_app(csv_path)
+        app.current_index = 3
+        app.data[3]['status'] = STATUS_CALLBACK
+        app._save_csv()
+
+        journal_path = csv_path.with_suffix('.journal.csv')
+        assert journal_path.exists()
+        with open(journal_path, newline='', encoding='utf-8') as f:
+            assert next(csv.reader(f))[1] == 'row_3'
+        print("✅ Edit journaled by external_row_id")
+
+        # Reorder and shorten the CSV between sessions: the edit must follow its row
+        _write_csv(csv_path, list(reversed(ROWS))[:-1])
+        replayed = _load_app(csv_path)
+        edited = [record for record in replayed.data if record['status'] == STATUS_CALLBACK]
+        assert [record['external_row_id'] for record in edited] == ['row_3']
+        assert replayed._dirty_ids == {'row_3'}
+        print("✅ Journal replayed onto the same contact after the CSV was reordered")
+
+
+def test_journal_skips_unknown_rows():
+    """Journal entries for rows no longer in the CSV are dropped, not applied elsewhere."""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / 'contacts.csv'
+        _write_csv(csv_path, ROWS)
+
+        app = _load_app(csv_path)
+        app.current_index = 0
+        app.data[0]['status'] = STATUS_CALLBACK
+        app._save_csv()
+
+        _write_csv(csv_path, ROWS[1:])
+        replayed = _load_app(csv_path)
+        assert all(record['status'] != STATUS_CALLBACK for record in replayed.data)
+        assert replayed._journal_entries == 0
+        print("✅ Journal entry for a removed row skipped")
+
+
+def test_journal_compaction():
+    """Once the journal passes JOURNAL_COMPACT_RATIO it is folded into the CSV and removed."""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / 'contacts.csv'
+        _write_csv(csv_path, ROWS)
+
+        original_backup_dir = vstudio_cli.BACKUP_DIR
+        vstudio_cli.BACKUP_DIR = tmp
+        try:
+            app = _load_app(csv_path)
+            limit = int(len(app.data) * vstudio_cli.JOURNAL_COMPACT_RATIO)
+            for i in range(limit + 1):
+                app.current_index = i
+                app.data[i]['status'] = STATUS_CALLBACK
+                app._save_csv()
+        finally:
+            vstudio_cli.BACKUP_DIR = original_backup_dir
+
+        assert not csv_path.with_suffix('.journal.csv').exists()
+        assert app._journal_entries == 0 and not app._dirty_ids
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            statuses = [row['status'] for row in csv.DictReader(f)]
+        assert statuses.count(STATUS_CALLBACK) == limit + 1
+        print("✅ Journal compacted into the CSV")
+
+
+def test_add_contacts_bulk_duplicates():
+    """Duplicate ids or phone numbers are skipped; the rest of the batch is still written."""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        export_path = Path(tmp) / 'export.csv'
+        db_manager = CRMDataManager(DatabaseConfig(csv_export_path=str(export_path)))
+
+        contacts = [
+            {'external_row_id': 'bulk_1', 'phone_number': '+16475550001', 'name': 'First'},
+            {'external_row_id': 'bulk_2', 'phone_number': '+16475550002', 'name': 'Second'},
+            {'external_row_id': 'bulk_1', 'phone_number': '+16475550003', 'name': 'Same id'},
+            {'external_row_id': 'bulk_4', 'phone_number': '+16475550002', 'name': 'Same phone'},
+        ]
+        assert db_manager.add_contacts_bulk(contacts) == 2
+        print("✅ Duplicates within a batch skipped")
+
+        again = [
+            {'external_row_id': 'bulk_1', 'phone_number': '+16475550009', 'name': 'Already stored'},
+            {'external_row_id': 'bulk_5', 'phone_number': '+16475550005', 'name': 'Fifth'},
+        ]
+        assert db_manager.add_contacts_bulk(again) == 1
+
+        with open(export_path, newline='', encoding='utf-8') as f:
+            ids = [row['external_row_id'] for row in csv.DictReader(f)]
+        assert ids == ['bulk_1', 'bulk_2', 'bulk_5']
+        assert db_manager.add_contacts_bulk([]) == 0
+        print("✅ Contacts already in the export file skipped")
+
+
+def test_events_in_range_with_utc_offsets():
+    """Callbacks and meetings stored with a 'Z' or '+00:00' suffix still show up in the calendar."""
+
+    db_manager = CRMDataManager(DatabaseConfig())
+    db_manager.contacts_data = [
+        {'external_row_id': 'cal_1', 'name': 'Naive', 'callback_on': '2025-03-14T10:00:00', 'notes': 'keep me'},
+        {'external_row_id': 'cal_2', 'name': 'Zulu', 'meeting_at': '2025-03-14T14:30:00Z'},
+        {'external_row_id': 'cal_3', 'name': 'Offset', 'callback_on': '2025-03-20T09:00:00+00:00'},
+        {'external_row_id': 'cal_4', 'name': 'Next month', 'meeting_at': '2025-04-02T09:00:00Z'},
+    ]
+
+    events = db_manager.get_events_in_range(datetime(2025, 3, 1), datetime(2025, 4, 1))
+    assert [event['external_row_id'] for event in events] == ['cal_1', 'cal_2', 'cal_3']
+    assert events[0]['notes'] == 'keep me'
+    print("✅ Calendar range includes dates with UTC offsets")
+
+
+def test_to_datetime_mixed_values():
+    """Date fields may hold ISO strings (CSV, older documents) or BSON datetimes."""
+
+    bson_date = datetime(2025, 3, 14, 9, 30)
+    assert _to_datetime(bson_date) is bson_date
+    assert _to_datetime('2025-03-14T09:30:00') == bson_date
+    assert _to_datetime('2025-03-14') == datetime(2025, 3, 14)
+    assert _to_datetime('2025-03-14T09:30:00Z').utcoffset().total_seconds() == 0
+    assert _to_datetime('') is None
+    assert _to_datetime(None) is None
+
+    try:
+        _to_datetime('not a date')
+        assert False, "invalid dates must raise"
+    except ValueError:
+        pass
+    print("✅ String and BSON dates parsed alike")
+
+
+if __name__ == "__main__":
+    test_journal_write_and_replay()
+    test_journal_skips_unknown_rows()
+    test_journal_compaction()
+    test_add_contacts_bulk_duplicates()
+    test_events_in_range_with_utc_offsets()
+    test_to_datetime_mixed_values()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test that _save_csv's changed-field diffing never skips a write after direct database updates
+"""
+
+import threading
+
+from vstudio_cli import VStudioCLI, STATUS_NEW, STATUS_CALLBACK
+
+
+class RecordingDataManager:
+    """Stands in for CRMDataManager and keeps the contact fields it was asked to write."""
+
+    def __init__(self):
+        self.contacts = {}
+        self.updates = []
+
+    def update_contact(self, contact_id, updates):
+        self.updates.append((contact_id, dict(updates)))
+        self.contacts.setdefault(contact_id, {}).update(updates)
+        return True
+
+
+class SlowDataManager(RecordingDataManager):
+    """Holds every write until the test opens the gate, like a slow MongoDB round trip."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+
+    def update_contact(self, contact_id, updates):
+        self.gate.wait(timeout=5)
+        return super().update_contact(contact_id, updates)
+
+
+class FailingDataManager(RecordingDataManager):
+    """Rejects every write."""
+
+    def update_contact(self, contact_id, updates):
+        self.updates.append((contact_id, dict(updates)))
+        return False
+
+
+def _make_app(record):
+    app = VStudioCLI(debug=False)
+    app.db_manager = RecordingDataManager()
+    app.data = [record]
+    app.current_index = 0
+    return app
+
+
+def test_outcome_after_direct_edit_is_written():
+    """Outcome -> edit screen reverts the status -> same outcome again must reach the database."""
+
+    print("🧪 SNAPSHOT SYNC TEST")
+    print("=" * 50)
+
+    record = {'external_row_id': 'snap_1', 'name': 'Snapshot Test', 'status': STATUS_NEW}
+    app = _make_app(record)
+    db = app.db_manager
+
+    # Call outcome: callback (synced through _save_csv)
+    record['status'] = STATUS_CALLBACK
+    app._save_csv()
+    app._drain_writes()
+    assert db.contacts['snap_1']['status'] == STATUS_CALLBACK
+    print("✅ Outcome written")
+
+    # Edit screen sets the status back to new (direct write)
+    record['status'] = STATUS_NEW
+    assert app._update_contact('snap_1', {'status': STATUS_NEW})
+    assert db.contacts['snap_1']['status'] == STATUS_NEW
+    print("✅ Direct edit written")
+
+    # Same outcome again: must not be skipped as "unchanged"
+    record['status'] = STATUS_CALLBACK
+    app._save_csv()
+    app._drain_writes()
+    assert db.contacts['snap_1']['status'] == STATUS_CALLBACK
+    print("✅ Repeated outcome written after the direct edit")
+
+    # Nothing changed since the last write: no extra database call
+    writes = len(db.updates)
+    app._save_csv()
+    app._drain_writes()
+    assert len(db.updates) == writes
+    print("✅ Unchanged record is not rewritten")
+
+
+def test_reload_drops_snapshot():
+    """Reloading self.data must forget what was last written."""
+
+    record = {'external_row_id': 'snap_2', 'name': 'Reload Test', 'status': STATUS_CALLBACK}
+    app = _make_app(record)
+
+    app._save_csv()
+    app._drain_writes()
+    assert 'snap_2' in app._snapshot
+
+    app._reindex()
+    assert app._snapshot == {}
+    print("✅ Snapshot cleared on reload")
+
+
+def test_change_and_change_back_while_queued():
+    """Two saves queued before the worker runs must both be written, in order."""
+
+    record = {'external_row_id': 'snap_3', 'name': 'Queue Test', 'status': STATUS_NEW}
+    app = _make_app(record)
+    app.db_manager = db = SlowDataManager()
+
+    record['status'] = STATUS_CALLBACK
+    app._save_csv()
+    record['status'] = STATUS_NEW
+    app._save_csv()
+
+    db.gate.set()
+    app._drain_writes()
+    assert [u[1]['status'] for u in db.updates] == [STATUS_CALLBACK, STATUS_NEW]
+    assert db.contacts['snap_3']['status'] == STATUS_NEW
+    print("✅ Change and change back both reached the database")
+
+
+def test_direct_write_waits_for_queued_outcome():
+    """A direct edit must not be overwritten by an older queued outcome."""
+
+    record = {'external_row_id': 'snap_4', 'name': 'Order Test', 'status': STATUS_NEW}
+    app = _make_app(record)
+    app.db_manager = db = SlowDataManager()
+
+    record['status'] = STATUS_CALLBACK
+    app._save_csv()
+    threading.Timer(0.2, db.gate.set).start()
+
+    record['status'] = STATUS_NEW
+    assert app._update_contact('snap_4', {'status': STATUS_NEW})
+    assert db.contacts['snap_4']['status'] == STATUS_NEW
+    print("✅ Direct edit applied after the queued outcome")
+
+
+def test_failed_write_is_retried():
+    """A rejected background write must not leave the snapshot claiming it succeeded."""
+
+    record = {'external_row_id': 'snap_5', 'name': 'Failure Test', 'status': STATUS_CALLBACK}
+    app = _make_app(record)
+    app.db_manager = db = FailingDataManager()
+
+    app._save_csv()
+    app._drain_writes()
+    assert 'snap_5' not in app._snapshot
+
+    app._save_csv()
+    app._drain_writes()
+    assert len(db.updates) == 2
+    print("✅ Failed write retried on the next save")
+
+
+if __name__ == "__main__":
+    test_outcome_after_direct_edit_is_written()
+    test_reload_drops_snapshot()
+    test_change_and_change_back_while_queued()
+    test_direct_write_waits_for_queued_outcome()
+    test_failed_write_is_retried()
@@ -9,11 +9,22 @@ to Google Calendar, and persists everything back to CSV with backups.
 
 import argparse
 import asyncio
+import atexit
+import calendar
 import csv
+import functools
 import json
 import logging
 import os
+import queue
+import shutil
+import subprocess
 import sys
+import threading
+import time
+import uuid
+import zlib
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta, date
@@ -31,7 +42,9 @@ try:
     from rich.text import Text
     from rich.layout import Layout
     from rich.live import Live
+    from rich.console import Group
     import dateparser
+    import dateparser.date
     import phonenumbers
     from phonenumbers import NumberParseException
     
@@ -52,7 +65,9 @@ load_dotenv()
 
 # Import our database manager
 try:
-    from database import CRMDataManager, DatabaseConfig, load_database_config
+    from database import (CRMDataManager, DatabaseConfig, load_database_config, apply_config_settings,
+                          PRIORITY_VIEW_SORTS, DEFAULT_VIEW_SORT, EDIT_HISTORY_COLLECTION,
+                          CSV_SHAPE_FIELDS)
     DATABASE_INTEGRATION = True
 except ImportError:
     DATABASE_INTEGRATION = False
@@ -63,6 +78,14 @@ KEYRING_SERVICE = "vstudio-cli"
 LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
 BACKUP_DIR = "backups"
 ARCHIVE_FILE = "archive.csv"
+FLUSH_INTERVAL_SECONDS = 30  # How often buffered archive rows hit the disk
+STATS_CACHE_TTL = 30.0  # Seconds the dashboard reuses CRM statistics between mutations
+MONTH_EVENTS_CACHE_TTL = 30.0  # Seconds the calendar reuses a month's events between mutations
+CSV_WRITE_BUFFER = 1 << 20  # 1 MiB write buffer when rewriting the CSV
+JOURNAL_COMPACT_RATIO = 0.1  # Fold the edit journal into the CSV once it exceeds 10% of the rows
+HISTORY_FLUSH_DELAY = 2.0  # Seconds to coalesce edit history entries before writing them
+HISTORY_BATCH_SIZE = 100  # Flush edit history immediately once this many entries are buffered
+WRITE_QUEUE_SIZE = 4096  # Pending background database writes before callers block
 
 # Google Calendar configuration
 GOOGLE_SCOPES = ['https://www.googleapis.com/auth/calendar']
@@ -80,8 +103,148 @@ STATUS_DELETED = "deleted"
 STATUS_CLOSE_WON = "close_won"
 STATUS_CLOSE_LOST = "close_lost"
 
+# Fields offered in the quick-edit screen
+EDITABLE_FIELDS = (
+    ('name', 'Name'),
+    ('company', 'Company'),
+    ('phone_number', 'Phone Number'),
+    ('email', 'Email'),
+    ('title', 'Title'),
+    ('address', 'Address'),
+    ('city', 'City'),
+    ('status', 'Status'),
+    ('notes', 'Notes'),
+    ('callback_on', 'Callback Date'),
+    ('meeting_at', 'Meeting Date/Time')
+)
+
+# Status choices offered when setting a status by hand
+STATUS_OPTIONS = (
+    (STATUS_NEW, 'New'),
+    (STATUS_CALLBACK, 'Callback Scheduled'),
+    (STATUS_MEETING_BOOKED, 'Meeting Booked'),
+    (STATUS_NO_ANSWER, 'No Answer'),
+    (STATUS_CLOSE_WON, '🎉 CLOSE WON (Client)'),
+    (STATUS_CLOSE_LOST, '❌ CLOSE LOST (Cemetery)'),
+    (STATUS_DO_NOT_CALL, 'Do Not Call'),
+    (STATUS_BAD_NUMBER, 'Bad Number')
+)
+
+# Initial status choices when creating a contact (blank input means new)
+NEW_CONTACT_STATUSES = {
+    '1': STATUS_NEW,
+    '2': STATUS_CALLBACK,
+    '3': STATUS_MEETING_BOOKED,
+    '': STATUS_NEW
+}
+
+# Welcome dashboard shortcuts that jump straight into a priority view
+DASHBOARD_VIEW_SHORTCUTS = {'d': 'overdue', 't': 'today', 'n': 'new'}
+
+# Contact fields _save_csv writes back to the database
+SYNCED_FIELDS = ('status', 'notes', 'last_call_at', 'callback_on', 'meeting_at')
+
 TERMINAL_STATUSES = {STATUS_DELETED, STATUS_DO_NOT_CALL, STATUS_BAD_NUMBER, STATUS_CLOSE_WON, STATUS_CLOSE_LOST}
 
+# Shared meeting date parser (built once so locale data is only loaded a single time)
+MEETING_DATE_PARSER = dateparser.date.DateDataParser(languages=['en'], settings={'PREFER_DATES_FROM': 'future'})
+
+
+def _load_contacts_view(db_manager, status: Optional[str], sort_spec: Optional[List]) -> List[Dict]:
+    """Load contacts (optionally one status) in CSV shape, sorted server-side when sort_spec is given."""
+    return db_manager.get_status_view_data(status, sort_spec, csv_shape=True)
+
+
+# View name -> (loader(db_manager, sort_spec), label)
+VIEW_LOADERS = {
+    'today': (lambda dbm, sort: dbm.get_priority_view_data('today', sort, csv_shape=True),
+              "[green]Today's Schedule[/green]"),
+    'overdue': (lambda dbm, sort: dbm.get_priority_view_data('overdue', sort, csv_shape=True),
+                "[red]Overdue Items[/red]"),
+    'new': (lambda dbm, sort: dbm.get_priority_view_data('new', sort, csv_shape=True),
+            "[yellow]New Contacts[/yellow]"),
+    'clients': (lambda dbm, sort: _load_contacts_view(dbm, STATUS_CLOSE_WON, sort),
+                "[bright_green]Clients (Close Won)[/bright_green]"),
+    'cemetery': (lambda dbm, sort: _load_contacts_view(dbm, STATUS_CLOSE_LOST, sort),
+                 "[dim red]Cemetery (Close Lost)[/dim red]"),
+    'all': (lambda dbm, sort: _load_contacts_view(dbm, None, sort),
+            "[blue]All Contacts[/blue]"),
+}
+
+
+def _to_datetime(value) -> Optional[datetime]:
+    """Return a stored date as a datetime: BSON dates come back from PyMongo as-is, ISO strings are parsed."""
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+@functools.lru_cache(maxsize=4096)
+def _priority_key(view_name: str, callback_on, meeting_at, company, today: date):
+    """Sort key for a record in a priority view (pure, so results are cached)."""
+    if view_name == "overdue":
+        # Sort overdue items by days overdue (most overdue first)
+        callback_days = 0
+        meeting_days = 0
+        
+        if callback_on:
+            try:
+                callback_date = _to_datetime(callback_on).date()
+                if callback_date < today:
+                    callback_days = (today - callback_date).days
+            except:
+                pass
+        
+        if meeting_at:
+            try:
+                meeting_date = _to_datetime(meeting_at).date()
+                if meeting_date < today:
+                    meeting_days = (today - meeting_date).days
+            except:
+                pass
+        
+        return -(max(callback_days, meeting_days))  # Negative for descending sort
+        
+    elif view_name == "today":
+        # Sort today's items by time (earliest first)
+        earliest_time = datetime.max.time()
+        
+        if callback_on:
+            try:
+                callback_date = _to_datetime(callback_on).date()
+                if callback_date == today:
+                    earliest_time = min(earliest_time, datetime.min.time().replace(hour=10))  # Default callback time
+            except:
+                pass
+        
+        if meeting_at:
+            try:
+                meeting_datetime = _to_datetime(meeting_at)
+                if meeting_datetime.date() == today:
+                    earliest_time = min(earliest_time, meeting_datetime.time())
+            except:
+                pass
+        
+        return earliest_time
+        
+    else:
+        # Default sorting by company name
+        return company.lower()
+
+
+@dataclass(frozen=True)
+class EventRecord:
+    """A callback or meeting shown on the calendar."""
+    __slots__ = ('type', 'contact', 'time', 'date', 'is_overdue')  # No per-event __dict__
+    
+    type: str  # 'callback' or 'meeting'
+    contact: Dict
+    time: str
+    date: date
+    is_overdue: bool
+
 
 class OperationQueue:
     """Queue manager for offline/failed operations."""
@@ -107,7 +270,7 @@ class OperationQueue:
         """Save queued operations to disk."""
         try:
             with open(self.queue_file, 'w') as f:
-                json.dump(self.operations, f, indent=2, default=str)
+                json.dump(self.operations, f, default=str)  # Compact: uses the C encoder
         except Exception as e:
             self.logger.error(f"Failed to save operation queue: {e}")
     
@@ -604,8 +767,9 @@ class VoIPStudioAPI:
 class VStudioCLI:
     """Main application class for VStudio CLI."""
     
-    def __init__(self, debug=False):
+    def __init__(self, debug=False, config_override: Optional[Dict[str, Any]] = None):
         self.console = Console()
+        self.config_override = config_override  # Database settings used instead of database_config.json
         self.csv_path = None
         self.data = []
         self.current_index = 0
@@ -617,6 +781,41 @@ class VStudioCLI:
         self.debug = debug
         self.testing_mode = False
         self.current_view = "all"  # all, today, overdue, new, clients, cemetery
+        self._phone_cache = {}  # (raw phone, region) -> normalized E.164 (or None)
+        self._headers_tuple = ()  # Column order used when writing the CSV
+        self._stats_cache = None  # (monotonic timestamp, testing_mode, stats) for the dashboard
+        self._display_cache = {}  # id(record) -> truncated field strings for the edit menu
+        self._snapshot = {}  # contact_id -> SYNCED_FIELDS values last written (or queued) to the database
+        self._snapshot_lock = threading.Lock()  # The write worker drops entries for failed writes
+        self._id_to_index = {}  # external_row_id -> position in self.data
+        self._options_table = None  # Dashboard quick actions (static, built on first use)
+        self._calendar_table = None  # (year, month, today, events, Table) for the last rendered month
+        self._month_events_cache = {}  # (year, month) -> (monotonic timestamp, events by day)
+        self._stats_ttl = STATS_CACHE_TTL
+        
+        # Buffered persistence (flushed periodically and on exit)
+        self._archive_buffer = []
+        self._csv_dirty = False
+        self._flush_lock = threading.RLock()
+        self._flush_timer = None
+        
+        # Edit history entries waiting to be written to MongoDB
+        self._history_buffer = []
+        self._history_lock = threading.Lock()
+        self._history_timer = None
+        
+        # Non-critical database writes handed off to a background worker
+        self._write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._write_thread = threading.Thread(target=self._write_worker, name="db-writer", daemon=True)
+        self._write_thread.start()
+        
+        # Append-only edit journal for CSV mode (folded into the CSV on compaction)
+        self._journal_path = None
+        self._journal_fp = None
+        self._journal_writer = None
+        self._journal_entries = 0
+        self._dirty_ids = set()
+        atexit.register(self._flush_all)
         
         # Database integration
         self.db_manager = None
@@ -666,6 +865,7 @@ class VStudioCLI:
         """Main entry point for the application."""
         try:
             self._initialize(csv_path)
+            self._schedule_flush()
             
             # Show welcome dashboard if using database
             if self.db_manager:
@@ -719,7 +919,10 @@ class VStudioCLI:
     def _initialize_database(self):
         """Initialize database connection."""
         try:
-            config = load_database_config()
+            if self.config_override is not None:
+                config = apply_config_settings(DatabaseConfig(), self.config_override)
+            else:
+                config = load_database_config()
             
             # Override database name for testing mode
             if self.testing_mode:
@@ -728,9 +931,9 @@ class VStudioCLI:
             
             self.db_manager = CRMDataManager(config)
             
-            # Test database connection by getting contacts
-            contacts = self.db_manager.get_contacts(limit=1)
-            self.console.print(f"[dim]Database connected - {len(self.db_manager.get_contacts())} contacts available[/dim]")
+            # Test database connection by counting contacts (a count, no documents transferred)
+            contact_count = self.db_manager.count_contacts()
+            self.console.print(f"[dim]Database connected - {contact_count} contacts available[/dim]")
             
         except Exception as e:
             self.logger.warning(f"Database initialization failed: {e}")
@@ -740,35 +943,13 @@ class VStudioCLI:
     def _load_from_database(self):
         """Load data from database."""
         try:
-            # Get contacts from database
-            contacts = self.db_manager.get_contacts()
-            
-            # Convert to the format expected by the existing UI code
-            self.data = []
-            for contact in contacts:
-                # Convert MongoDB document to CSV-like format for compatibility
-                csv_record = {
-                    'external_row_id': contact.get('external_row_id', str(contact.get('_id', ''))),
-                    'phone_number': contact.get('phone_number', ''),
-                    'name': contact.get('name', ''),
-                    'email': contact.get('email', ''),
-                    'company': contact.get('company', ''),
-                    'title': contact.get('title', ''),
-                    'address': contact.get('address', ''),
-                    'city': contact.get('city', ''),
-                    'source': contact.get('source', ''),
-                    'status': contact.get('status', 'new'),
-                    'notes': '',  # Will be populated from interactions if needed
-                    'last_call_at': '',
-                    'callback_on': '',
-                    'meeting_at': '',
-                    'gcal_callback_event_id': '',
-                    'gcal_meeting_event_id': ''
-                }
-                self.data.append(csv_record)
+            # Get contacts from database, already in the CSV-like format the UI expects
+            self.data = self.db_manager.get_contacts(csv_shape=True)
+            self._reindex()
             
             # Set up headers for CSV compatibility
-            self.headers = list(csv_record.keys()) if self.data else []
+            self.headers = list(CSV_SHAPE_FIELDS) if self.data else []
+            self._headers_tuple = tuple(self.headers)
             
             self.console.print(f"[green]✓ Loaded {len(self.data)} contacts from database[/green]")
             
@@ -826,14 +1007,13 @@ class VStudioCLI:
         issues = []
         
         for i, row in enumerate(self.data):
-            # Generate external_row_id for new rows
+            # Generate external_row_id for new rows (stable across sessions: the edit journal is keyed by it)
             if not row.get('external_row_id'):
-                content_hash = hash(f"{row.get('phone_number', '')}{row.get('name', '')}{row.get('company', '')}")
-                row['external_row_id'] = f"{self.csv_path.stem}_{i}_{abs(content_hash)}"
+                content_hash = zlib.crc32(f"{row.get('phone_number', '')}{row.get('name', '')}{row.get('company', '')}".encode())
+                row['external_row_id'] = f"{self.csv_path.stem}_{i}_{content_hash}"
             
-            # Set default status
-            if not row.get('status'):
-                row['status'] = STATUS_NEW
+            # Set default status (interned: statuses are compared constantly)
+            row['status'] = sys.intern(row['status']) if row.get('status') else STATUS_NEW
             
             # Validate phone_number number
             phone_number = row.get('phone_number', '').strip()
@@ -853,6 +1033,12 @@ class VStudioCLI:
             valid_rows.append(row)
         
         self.data = valid_rows
+        self._reindex()
+        self._headers_tuple = tuple(self.headers)
+        
+        # Re-apply edits journaled since the last compaction
+        self._journal_path = self.csv_path.with_suffix('.journal.csv')
+        self._replay_journal()
         
         # Report issues but don't fail completely
         if issues:
@@ -1048,7 +1234,7 @@ class VStudioCLI:
         # Add timing information
         if record.get('last_call_at'):
             try:
-                last_call = datetime.fromisoformat(record['last_call_at'].replace('Z', '+00:00'))
+                last_call = _to_datetime(record['last_call_at'])
                 header_parts.append(f"Last Call: {last_call.strftime('%Y-%m-%d %H:%M')}")
             except:
                 header_parts.append(f"Last Call: {record['last_call_at']}")
@@ -1058,7 +1244,7 @@ class VStudioCLI:
         
         if record.get('meeting_at'):
             try:
-                meeting = datetime.fromisoformat(record['meeting_at'].replace('Z', '+00:00'))
+                meeting = _to_datetime(record['meeting_at'])
                 header_parts.append(f"[green]Meeting: {meeting.strftime('%Y-%m-%d %H:%M')}[/green]")
             except:
                 header_parts.append(f"Meeting: {record['meeting_at']}")
@@ -1158,7 +1344,7 @@ class VStudioCLI:
         # Check for overdue callback
         if record.get('callback_on'):
             try:
-                callback_date = datetime.fromisoformat(record['callback_on']).date()
+                callback_date = _to_datetime(record['callback_on']).date()
                 if callback_date < today:
                     days_overdue = (today - callback_date).days
                     if days_overdue == 1:
@@ -1175,7 +1361,7 @@ class VStudioCLI:
         # Check for overdue meeting
         if record.get('meeting_at'):
             try:
-                meeting_datetime = datetime.fromisoformat(record['meeting_at'])
+                meeting_datetime = _to_datetime(record['meeting_at'])
                 meeting_date = meeting_datetime.date()
                 if meeting_date < today:
                     days_overdue = (today - meeting_date).days
@@ -1197,57 +1383,9 @@ class VStudioCLI:
         """Sort data based on priority for the current view."""
         today = datetime.now().date()
         
-        def priority_key(record):
-            if view_name == "overdue":
-                # Sort overdue items by days overdue (most overdue first)
-                callback_days = 0
-                meeting_days = 0
-                
-                if record.get('callback_on'):
-                    try:
-                        callback_date = datetime.fromisoformat(record['callback_on']).date()
-                        if callback_date < today:
-                            callback_days = (today - callback_date).days
-                    except:
-                        pass
-                
-                if record.get('meeting_at'):
-                    try:
-                        meeting_date = datetime.fromisoformat(record['meeting_at']).date()
-                        if meeting_date < today:
-                            meeting_days = (today - meeting_date).days
-                    except:
-                        pass
-                
-                return -(max(callback_days, meeting_days))  # Negative for descending sort
-                
-            elif view_name == "today":
-                # Sort today's items by time (earliest first)
-                earliest_time = datetime.max.time()
-                
-                if record.get('callback_on'):
-                    try:
-                        callback_date = datetime.fromisoformat(record['callback_on']).date()
-                        if callback_date == today:
-                            earliest_time = min(earliest_time, datetime.min.time().replace(hour=10))  # Default callback time
-                    except:
-                        pass
-                
-                if record.get('meeting_at'):
-                    try:
-                        meeting_datetime = datetime.fromisoformat(record['meeting_at'])
-                        if meeting_datetime.date() == today:
-                            earliest_time = min(earliest_time, meeting_datetime.time())
-                    except:
-                        pass
-                
-                return earliest_time
-                
-            else:
-                # Default sorting by company name
-                return record.get('company', '').lower()
-        
-        return sorted(data, key=priority_key)
+        return sorted(data, key=lambda record: _priority_key(
+            view_name, record.get('callback_on'), record.get('meeting_at'), record.get('company', ''), today
+        ))
     
     def _format_notes(self, notes: str) -> str:
         """Format timestamped notes for display."""
@@ -1410,6 +1548,11 @@ class VStudioCLI:
         if not phone:
             return None
         
+        cache_key = (phone, default_region)
+        if cache_key in self._phone_cache:
+            return self._phone_cache[cache_key]
+        
+        normalized = None
         try:
             # Parse the phone number
             parsed = phonenumbers.parse(phone, default_region)
@@ -1417,14 +1560,15 @@ class VStudioCLI:
             # Validate the number
             if phonenumbers.is_valid_number(parsed):
                 # Format as E.164
-                return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+                normalized = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
             else:
                 self.logger.warning(f"Invalid phone number: {phone}")
-                return None
                 
         except NumberParseException as e:
             self.logger.error(f"Failed to parse phone number '{phone}': {e}")
-            return None
+        
+        self._phone_cache[cache_key] = normalized
+        return normalized
     
     def _format_phone_for_voipstudio(self, phone: str) -> Optional[str]:
         """Format phone number for VoIP Studio API (E.164 without plus sign)."""
@@ -1440,14 +1584,10 @@ class VStudioCLI:
             self._debug_print("No current call ID, exiting monitor")
             return
         
-        import time
-        from rich.live import Live
-        from rich.table import Table
-        from rich.text import Text
-        
         start_time = time.time()
         poll_count = 0
         last_status = None
+        last_call_hash = None
         max_poll_attempts = 30  # Maximum polling attempts before forcing outcome menu
         
         def create_call_display():
@@ -1478,23 +1618,28 @@ class VStudioCLI:
                         self._debug_print(f"Call data received: {call_data}")
                         
                         if call_data:
-                            # Extract status from call data
-                            status = self._extract_call_status(call_data)
-                            self._debug_print(f"Extracted status: {status}")
-                            
-                            if status != last_status:
-                                last_status = status
-                                self._debug_print(f"Status changed to: {status}")
-                                live.update(create_call_display())
-                            
-                            # Check if call ended
-                            if self._is_call_ended(status, call_data):
-                                self._debug_print(f"Call ended with status: {status}")
-                                call_ended = True
-                                final_status = status
-                                live.update(create_call_display())
-                                time.sleep(2)  # Show final status briefly
-                                break
+                            # Only re-parse the payload when it differs from the previous poll
+                            call_hash = hash(json.dumps(call_data, sort_keys=True, default=str))
+                            if call_hash != last_call_hash:
+                                last_call_hash = call_hash
+                                
+                                # Extract status from call data
+                                status = self._extract_call_status(call_data)
+                                self._debug_print(f"Extracted status: {status}")
+                                
+                                if status != last_status:
+                                    last_status = status
+                                    self._debug_print(f"Status changed to: {status}")
+                                    live.update(create_call_display())
+                                
+                                # Check if call ended
+                                if self._is_call_ended(status, call_data):
+                                    self._debug_print(f"Call ended with status: {status}")
+                                    call_ended = True
+                                    final_status = status
+                                    live.update(create_call_display())
+                                    time.sleep(2)  # Show final status briefly
+                                    break
                                 
                         elif poll_count > 10:  # Call not found after many attempts
                             self._debug_print("Call not found after many attempts, assuming completed")
@@ -1609,6 +1754,8 @@ class VStudioCLI:
         
         handler = outcome_handlers.get(choice, self._outcome_no_answer)
         handler()
+        self._invalidate_stats()
+        self._invalidate_month_events()
         
         # Show confirmation of action taken
         self.console.print(f"[green]✓ Outcome recorded: {self._get_outcome_description(choice)}[/green]")
@@ -1732,7 +1879,7 @@ class VStudioCLI:
             show_default=True
         )
         
-        meeting_datetime = dateparser.parse(datetime_input, settings={'PREFER_DATES_FROM': 'future'})
+        meeting_datetime = MEETING_DATE_PARSER.get_date_data(datetime_input).date_obj
         
         if not meeting_datetime:
             self.console.print("[red]Invalid date/time format. Try: 'tomorrow 2pm', 'next Friday 10am', '2024-01-15 14:00'[/red]")
@@ -1958,6 +2105,7 @@ class VStudioCLI:
             record['status'] = STATUS_DELETED
             self._archive_record()
             self._save_csv()
+            self._invalidate_stats()
             self._next_record()
     
     def _add_note(self):
@@ -1966,6 +2114,7 @@ class VStudioCLI:
         if note:
             self._add_timestamped_note(note)
             self._save_csv()
+            self._invalidate_stats()
     
     def _add_timestamped_note(self, note: str):
         """Add a timestamped note to the current record."""
@@ -1983,7 +2132,7 @@ class VStudioCLI:
                     'body': note,
                     'direction': 'outbound'
                 }
-                self.db_manager.create_interaction(contact_id, interaction_data)
+                self._submit_write(self.db_manager.create_interaction, contact_id, interaction_data)
         
         # Also update the in-memory record for UI compatibility
         existing_notes = record.get('notes', '')
@@ -2083,19 +2232,11 @@ class VStudioCLI:
             self.console.print("[yellow]Search cancelled[/yellow]")
     
     def _archive_record(self):
-        """Archive the current record."""
+        """Archive the current record (buffered until the next flush)."""
         record = self.data[self.current_index].copy()
         record['archived_at'] = datetime.now().isoformat()
-        
-        # Append to archive file
-        archive_path = Path(ARCHIVE_FILE)
-        file_exists = archive_path.exists()
-        
-        with open(archive_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=self.headers + ['archived_at'])
-            if not file_exists:
-                writer.writeheader()
-            writer.writerow(record)
+        with self._flush_lock:  # The timer thread writes and clears the buffer under this lock
+            self._archive_buffer.append(record)
     
     def _save_csv(self):
         """Save the data (to database if available, otherwise CSV)."""
@@ -2107,30 +2248,200 @@ class VStudioCLI:
                 contact_id = current_record.get('external_row_id')
                 
                 if contact_id:
-                    # Update the contact in database
-                    updates = {
-                        'status': current_record.get('status'),
-                        'metadata.updated_at': datetime.utcnow()
-                    }
+                    # Only write fields that differ from what we last saved (or queued) for this contact.
+                    # The snapshot is updated here, not by the worker, so quick successive saves
+                    # are diffed against each other rather than against the last completed write.
+                    with self._snapshot_lock:
+                        saved = self._snapshot.setdefault(contact_id, {})
+                        changed = {
+                            field: current_record[field] for field in SYNCED_FIELDS
+                            if current_record.get(field) and current_record[field] != saved.get(field)
+                        }
+                        saved.update(changed)
                     
-                    # Add any other changed fields
-                    for field in ['notes', 'last_call_at', 'callback_on', 'meeting_at']:
-                        if current_record.get(field):
-                            updates[field] = current_record[field]
+                    if not changed:
+                        return
                     
-                    success = self.db_manager.update_contact(contact_id, updates)
-                    if success:
-                        self.logger.info("Contact updated in database")
-                    else:
-                        self.logger.warning("Failed to update contact in database")
+                    updates = dict(changed)
+                    updates['metadata.updated_at'] = datetime.utcnow()
+                    
+                    self._submit_write(self._write_contact_update, contact_id, updates)
                         
             except Exception as e:
                 self.logger.error(f"Database save failed: {e}")
                 # Fall back to CSV mode for this save
                 self._save_to_csv_file()
         else:
-            # Save to CSV file
-            self._save_to_csv_file()
+            # Journal the changed row instead of rewriting the whole CSV
+            with self._flush_lock:
+                self._journal_write(self.data[self.current_index])
+                self._maybe_compact_journal()
+    
+    def _write_contact_update(self, contact_id: str, updates: Dict):
+        """Write a contact update to the database (runs on the write worker)."""
+        success = False
+        try:
+            success = self.db_manager.update_contact(contact_id, updates)
+        finally:
+            if not success:
+                # The snapshot already claims these values: forget it so the next save rewrites them
+                with self._snapshot_lock:
+                    self._snapshot.pop(contact_id, None)
+        
+        if success:
+            self.logger.info("Contact updated in database")
+        else:
+            self.logger.warning("Failed to update contact in database")
+    
+    def _update_contact(self, contact_id: str, updates: Dict) -> bool:
+        """Write fields straight to the database, keeping the _save_csv snapshot in step.
+        
+        Queued writes are applied first so an older outcome cannot land after this edit.
+        """
+        self._drain_writes()
+        success = self.db_manager.update_contact(contact_id, updates)
+        with self._snapshot_lock:
+            if success:
+                self._snapshot.setdefault(contact_id, {}).update(
+                    {field: value for field, value in updates.items() if field in SYNCED_FIELDS}
+                )
+            else:
+                # Unknown database state: make the next _save_csv write every synced field
+                self._snapshot.pop(contact_id, None)
+        return success
+    
+    def _submit_write(self, fn, *args):
+        """Queue a non-critical database write for the background worker."""
+        if self._write_thread.is_alive():
+            self._write_queue.put((fn, args))  # Blocks when the queue is full rather than dropping writes
+        else:
+            fn(*args)
+    
+    def _write_worker(self):
+        """Run queued database writes one at a time, in submission order."""
+        while True:
+            fn, args = self._write_queue.get()
+            try:
+                fn(*args)
+            except Exception as e:
+                self.logger.error(f"Background database write failed: {e}")
+            finally:
+                self._write_queue.task_done()
+    
+    def _drain_writes(self):
+        """Wait until every queued database write has been applied."""
+        if self._write_thread.is_alive():
+            self._write_queue.join()
+    
+    def _journal_write(self, record: Dict):
+        """Append a changed row to the edit journal, keyed by its external_row_id."""
+        if self._journal_fp is None:
+            self._journal_fp = open(self._journal_path, 'a', newline='', encoding='utf-8')
+            self._journal_writer = csv.writer(self._journal_fp)
+        
+        contact_id = record.get('external_row_id')
+        self._journal_writer.writerow((datetime.now().isoformat(), contact_id, json.dumps(record, default=str)))
+        self._journal_fp.flush()
+        self._journal_entries += 1
+        self._dirty_ids.add(contact_id)
+        self._csv_dirty = True
+    
+    def _maybe_compact_journal(self):
+        """Fold the journal into the CSV once it grows past JOURNAL_COMPACT_RATIO of the rows."""
+        if self._journal_entries > len(self.data) * JOURNAL_COMPACT_RATIO:
+            self._compact_journal()
+    
+    def _compact_journal(self):
+        """Rewrite the CSV with all journaled changes and start a fresh journal."""
+        self._save_to_csv_file()
+        
+        if self._journal_fp:
+            self._journal_fp.close()
+            self._journal_fp = None
+            self._journal_writer = None
+        if self._journal_path and self._journal_path.exists():
+            self._journal_path.unlink()
+        
+        self._journal_entries = 0
+        self._dirty_ids.clear()
+        self._csv_dirty = False
+    
+    def _replay_journal(self):
+        """Apply journaled rows left over from a previous session to self.data.
+        
+        Entries are matched by external_row_id, so rows added, removed or reordered in
+        the CSV since the journal was written cannot receive another row's edits;
+        entries whose id no longer exists are skipped.
+        """
+        if not self._journal_path.exists():
+            return
+        
+        replayed = 0
+        skipped = 0
+        try:
+            with open(self._journal_path, 'r', newline='', encoding='utf-8') as f:
+                for entry in csv.reader(f):
+                    try:
+                        _, contact_id, payload = entry
+                        record = json.loads(payload)
+                    except ValueError:
+                        continue  # Partially written entry from an interrupted session
+                    
+                    index = self._id_to_index.get(contact_id)
+                    if index is None or record.get('external_row_id') != contact_id:
+                        skipped += 1
+                        continue
+                    
+                    self.data[index] = record
+                    self._dirty_ids.add(contact_id)
+                    replayed += 1
+        except Exception as e:
+            self.logger.error(f"Failed to replay edit journal: {e}")
+            return
+        
+        self._journal_entries = replayed
+        self._csv_dirty = replayed > 0
+        if replayed:
+            self.console.print(f"[yellow]Recovered {replayed} unsaved edits from {self._journal_path.name}[/yellow]")
+        if skipped:
+            self.logger.warning(f"Skipped {skipped} journaled edits for rows no longer in {self.csv_path.name}")
+    
+    def _flush_archive(self):
+        """Append all buffered archive rows to the archive file in one write."""
+        with self._flush_lock:
+            if self._archive_buffer:
+                archive_path = Path(ARCHIVE_FILE)
+                file_exists = archive_path.exists()
+                
+                with open(archive_path, 'a', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=self.headers + ['archived_at'])
+                    if not file_exists:
+                        writer.writeheader()
+                    writer.writerows(self._archive_buffer)
+                self._archive_buffer.clear()
+    
+    def _flush_all(self):
+        """Write queued database writes, buffered archive rows, edit history and any journaled CSV edits."""
+        self._drain_writes()
+        self._flush_history()
+        
+        with self._flush_lock:
+            self._flush_archive()
+            
+            if self._csv_dirty:
+                self._compact_journal()
+    
+    def _schedule_flush(self):
+        """Flush buffered archive rows now and re-arm the periodic flush timer."""
+        try:
+            self._flush_archive()
+        except Exception as e:
+            self.logger.error(f"Periodic flush failed: {e}")
+        
+        if self.running:
+            self._flush_timer = threading.Timer(FLUSH_INTERVAL_SECONDS, self._schedule_flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
     
     def _save_to_csv_file(self):
         """Save data to CSV file with backup."""
@@ -2138,25 +2449,40 @@ class VStudioCLI:
             return
             
         # Create backup
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         backup_path = Path(BACKUP_DIR) / f"{self.csv_path.stem}_{timestamp}.csv"
         
         if self.csv_path.exists():
-            import shutil
-            shutil.copy2(self.csv_path, backup_path)
+            self._fast_backup(self.csv_path, backup_path)
         
         # Write to temporary file then replace
         temp_path = self.csv_path.with_suffix('.tmp')
         
-        with open(temp_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=self.headers)
-            writer.writeheader()
-            writer.writerows(self.data)
+        headers = self._headers_tuple
+        with open(temp_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            writer.writerows([record.get(h, '') for h in headers] for record in self.data)
         
         # Atomic replace
         temp_path.replace(self.csv_path)
         self.logger.info(f"CSV saved with backup: {backup_path}")
     
+    def _fast_backup(self, src: Path, dst: Path):
+        """Snapshot src to dst without copying bytes where the filesystem allows it.
+        
+        The CSV is always replaced via rename, so a hardlink keeps pointing at
+        the pre-save contents.
+        """
+        try:
+            os.link(src, dst)  # Hardlink: metadata only
+        except OSError:
+            try:
+                subprocess.run(['cp', '--reflink=auto', str(src), str(dst)], check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except Exception:
+                shutil.copy2(src, dst)
+    
     def _terminate_current_call(self):
         """Terminate the current active call."""
         if self.current_call_id and self.api_client:
@@ -2174,58 +2500,29 @@ class VStudioCLI:
         
         old_view = self.current_view
         self.current_view = view_name
+        self._drain_writes()  # Make sure the view reflects outcomes still queued for the database
+        
+        # MongoDB sorts the views server-side; the CSV backend falls back to Python
+        server_sorted = bool(self.db_manager.config.use_mongodb and self.db_manager.mongodb)
+        sort_spec = PRIORITY_VIEW_SORTS.get(view_name, DEFAULT_VIEW_SORT) if server_sorted else None
         
         try:
-            # Load data for the new view
-            if view_name == "today":
-                new_data = self.db_manager.get_priority_view_data("today")
-                view_label = "[green]Today's Schedule[/green]"
-            elif view_name == "overdue":
-                new_data = self.db_manager.get_priority_view_data("overdue")
-                view_label = "[red]Overdue Items[/red]"
-            elif view_name == "new":
-                new_data = self.db_manager.get_priority_view_data("new")
-                view_label = "[yellow]New Contacts[/yellow]"
-            elif view_name == "clients":
-                new_data = self.db_manager.get_contacts_by_status(STATUS_CLOSE_WON)
-                view_label = "[bright_green]Clients (Close Won)[/bright_green]"
-            elif view_name == "cemetery":
-                new_data = self.db_manager.get_contacts_by_status(STATUS_CLOSE_LOST)
-                view_label = "[dim red]Cemetery (Close Lost)[/dim red]"
-            else:  # "all"
-                new_data = self.db_manager.get_contacts()
-                view_label = "[blue]All Contacts[/blue]"
+            # Load data for the new view (unknown names fall back to "all")
+            loader, view_label = VIEW_LOADERS.get(view_name, VIEW_LOADERS['all'])
+            new_data = loader(self.db_manager, sort_spec)
             
             if not new_data:
                 self.console.print(f"[yellow]No contacts found in {view_label} view[/yellow]")
                 self.current_view = old_view  # Revert to old view
                 return
             
-            # Convert database records to CSV format for compatibility
-            self.data = []
-            for contact in new_data:
-                csv_record = {
-                    'external_row_id': contact.get('external_row_id', str(contact.get('_id', ''))),
-                    'phone_number': contact.get('phone_number', ''),
-                    'name': contact.get('name', ''),
-                    'email': contact.get('email', ''),
-                    'company': contact.get('company', ''),
-                    'title': contact.get('title', ''),
-                    'address': contact.get('address', ''),
-                    'city': contact.get('city', ''),
-                    'source': contact.get('source', ''),
-                    'status': contact.get('status', 'new'),
-                    'notes': '',  # Will be populated from interactions if needed
-                    'last_call_at': '',
-                    'callback_on': contact.get('callback_on', ''),
-                    'meeting_at': contact.get('meeting_at', ''),
-                    'gcal_callback_event_id': '',
-                    'gcal_meeting_event_id': ''
-                }
-                self.data.append(csv_record)
+            # Records already come back in CSV format from the database layer
+            self.data = new_data
             
-            # Sort data based on priority for the view
-            self.data = self._sort_data_by_priority(self.data, view_name)
+            # Sort data based on priority for the view (already sorted by MongoDB)
+            if not server_sorted:
+                self.data = self._sort_data_by_priority(self.data, view_name)
+            self._reindex()
             
             # Reset to first record
             self.current_index = 0
@@ -2237,6 +2534,22 @@ class VStudioCLI:
             self.console.print(f"[red]Failed to load {view_name} view[/red]")
             self.current_view = old_view
     
+    def _reindex(self):
+        """Rebuild the external_row_id -> position map after self.data is replaced or reordered.
+        
+        Loaded status strings are interned at the same time so the many status
+        comparisons compare equal by identity. The _save_csv snapshot is dropped
+        because the reloaded records reflect the database, not our last writes.
+        """
+        with self._snapshot_lock:
+            self._snapshot.clear()
+        self._id_to_index = {}
+        for i, record in enumerate(self.data):
+            self._id_to_index[record.get('external_row_id')] = i
+            status = record.get('status')
+            if isinstance(status, str):
+                record['status'] = sys.intern(status)
+    
     def _edit_current_record(self):
         """Edit fields in the current record with history tracking."""
         if not self.data or self.current_index >= len(self.data):
@@ -2249,41 +2562,21 @@ class VStudioCLI:
         # Create backup for history
         original_record = record.copy()
         
+        # Record may have changed outside the edit screen since it was last shown
+        self._display_cache.pop(id(record), None)
+        
+        editable_fields = EDITABLE_FIELDS
+        
+        redraw = True
         while True:
-            self.console.clear()
-            
-            # Display current record
-            self._display_record()
-            
-            # Show editable fields
-            editable_fields = [
-                ('name', 'Name'),
-                ('company', 'Company'), 
-                ('phone_number', 'Phone Number'),
-                ('email', 'Email'),
-                ('title', 'Title'),
-                ('address', 'Address'),
-                ('city', 'City'),
-                ('status', 'Status'),
-                ('notes', 'Notes'),
-                ('callback_on', 'Callback Date'),
-                ('meeting_at', 'Meeting Date/Time')
-            ]
-            
-            self.console.print(f"\n[bold cyan]📝 Quick Edit Mode[/bold cyan]")
-            self.console.print(f"[cyan]Select field to edit:[/cyan]")
-            
-            # Display numbered fields
-            for i, (field_key, field_name) in enumerate(editable_fields, 1):
-                current_value = record.get(field_key, '')
-                if isinstance(current_value, str):
-                    display_value = current_value[:50] + "..." if len(str(current_value)) > 50 else current_value
-                else:
-                    display_value = str(current_value) if current_value else ''
-                self.console.print(f"[dim]{i:2}.[/dim] {field_name:15} [yellow]{display_value}[/yellow]")
-            
-            self.console.print(f"\n[cyan]Actions:[/cyan]")
-            self.console.print(f"[cyan]1-{len(editable_fields)}[/cyan] Edit Field  [cyan]s[/cyan] Set Status  [cyan]h[/cyan] History  [cyan]b[/cyan] Back")
+            # Invalid input only adds an error line; keep the screen as it is
+            if redraw:
+                self.console.clear()
+                
+                # Display current record
+                self._display_record()
+                self.console.print(self._build_edit_panel(record, editable_fields))
+            redraw = True
             
             action = self.console.input("\n[bold]Select field or action → [/bold]").strip().lower()
             
@@ -2300,10 +2593,43 @@ class VStudioCLI:
                     self._edit_field(record, field_key, field_name, original_record)
                 else:
                     self.console.print(f"[red]Please enter a number between 1 and {len(editable_fields)}[/red]")
-                    self.console.input("Press Enter to continue...")
+                    redraw = False
             else:
                 self.console.print("[red]Invalid selection[/red]")
-                self.console.input("Press Enter to continue...")
+                redraw = False
+    
+    def _build_edit_panel(self, record: Dict, editable_fields: List) -> Group:
+        """Build the quick-edit field list and action bar as one renderable."""
+        display_values = self._get_display_values(record, editable_fields)
+        
+        lines = [
+            "\n[bold cyan]📝 Quick Edit Mode[/bold cyan]",
+            "[cyan]Select field to edit:[/cyan]"
+        ]
+        for i, (field_key, field_name) in enumerate(editable_fields, 1):
+            lines.append(f"[dim]{i:2}.[/dim] {field_name:15} [yellow]{display_values[field_key]}[/yellow]")
+        
+        lines.append("\n[cyan]Actions:[/cyan]")
+        lines.append(f"[cyan]1-{len(editable_fields)}[/cyan] Edit Field  [cyan]s[/cyan] Set Status  [cyan]h[/cyan] History  [cyan]b[/cyan] Back")
+        
+        return Group(*lines)
+    
+    def _get_display_values(self, record: Dict, editable_fields: List) -> Dict[str, str]:
+        """Return the truncated display strings for a record, built once until it is edited."""
+        cached = self._display_cache.get(id(record))
+        if cached is not None:
+            return cached
+        
+        display_values = {}
+        for field_key, _ in editable_fields:
+            value = record.get(field_key, '')
+            if isinstance(value, str):
+                display_values[field_key] = value[:50] + "..." if len(value) > 50 else value
+            else:
+                display_values[field_key] = str(value) if value else ''
+        
+        self._display_cache[id(record)] = display_values
+        return display_values
     
     def _edit_field(self, record: Dict, field_key: str, field_name: str, original_record: Dict):
         """Edit a specific field with validation."""
@@ -2323,12 +2649,16 @@ class VStudioCLI:
             
             # Update the record
             record[field_key] = new_value
+            self._display_cache.pop(id(record), None)
+            if field_key in ('callback_on', 'meeting_at'):
+                self._invalidate_stats()
+                self._invalidate_month_events()
             
             # Save to database
             if self.db_manager:
                 contact_id = record.get('external_row_id')
                 if contact_id:
-                    success = self.db_manager.update_contact(contact_id, {field_key: new_value})
+                    success = self._update_contact(contact_id, {field_key: new_value})
                     if success:
                         self.console.print(f"[green]✅ {field_name} updated successfully[/green]")
                     else:
@@ -2340,16 +2670,7 @@ class VStudioCLI:
         
     def _edit_status_field(self, record: Dict, original_record: Dict):
         """Edit status with predefined options."""
-        statuses = [
-            ('new', 'New'),
-            ('callback', 'Callback Scheduled'),
-            ('meeting_booked', 'Meeting Booked'), 
-            ('no_answer', 'No Answer'),
-            ('close_won', '🎉 CLOSE WON (Client)'),
-            ('close_lost', '❌ CLOSE LOST (Cemetery)'),
-            ('do_not_call', 'Do Not Call'),
-            ('bad_number', 'Bad Number')
-        ]
+        statuses = STATUS_OPTIONS
         
         self.console.print(f"\n[bold cyan]📊 Set Status[/bold cyan]")
         current_status = record.get('status', 'new')
@@ -2375,12 +2696,14 @@ class VStudioCLI:
                     
                     # Update record
                     record['status'] = new_status_key
+                    self._display_cache.pop(id(record), None)
+                    self._invalidate_stats()
                     
                     # Save to database  
                     if self.db_manager:
                         contact_id = record.get('external_row_id')
                         if contact_id:
-                            success = self.db_manager.update_contact(contact_id, {'status': new_status_key})
+                            success = self._update_contact(contact_id, {'status': new_status_key})
                             if success:
                                 self.console.print(f"[green]✅ Status updated to {new_status_name}[/green]")
                                 
@@ -2410,14 +2733,36 @@ class VStudioCLI:
                 'user': 'system'  # Could be enhanced with actual user tracking
             }
             
-            # Save to edit_history collection
+            # Buffer for the edit_history collection; written in batches by _flush_history
             if hasattr(self.db_manager, 'mongodb') and self.db_manager.mongodb:
-                collection = self.db_manager.mongodb.db['edit_history']
-                collection.insert_one(history_entry)
+                with self._history_lock:
+                    self._history_buffer.append(history_entry)
+                    buffered = len(self._history_buffer)
+                    
+                    if buffered < HISTORY_BATCH_SIZE and self._history_timer is None:
+                        self._history_timer = threading.Timer(HISTORY_FLUSH_DELAY, self._flush_history)
+                        self._history_timer.daemon = True
+                        self._history_timer.start()
+                
+                if buffered >= HISTORY_BATCH_SIZE:
+                    self._flush_history()
                 
         except Exception as e:
             self.logger.error(f"Failed to save edit history: {e}")
     
+    def _flush_history(self, acknowledged: bool = False):
+        """Write all buffered edit history entries with a single insert_many."""
+        with self._history_lock:
+            if self._history_timer:
+                self._history_timer.cancel()
+                self._history_timer = None
+            if not self._history_buffer:
+                return
+            batch, self._history_buffer = self._history_buffer, []
+        
+        if not self.db_manager.insert_edit_history(batch, acknowledged):
+            self.logger.error(f"Failed to flush {len(batch)} edit history entries")
+    
     def _show_edit_history(self, contact_id: str):
         """Show edit history for a contact with revert options."""
         if not self.db_manager or not contact_id:
@@ -2427,7 +2772,10 @@ class VStudioCLI:
             
         try:
             if hasattr(self.db_manager, 'mongodb') and self.db_manager.mongodb:
-                collection = self.db_manager.mongodb.db['edit_history']
+                # Make sure edits still sitting in the buffer show up
+                self._flush_history(acknowledged=True)
+                
+                collection = self.db_manager.mongodb.db[EDIT_HISTORY_COLLECTION]
                 history = list(collection.find({'contact_id': contact_id}).sort('timestamp', -1).limit(20))
                 
                 if not history:
@@ -2440,7 +2788,6 @@ class VStudioCLI:
                 self.console.print(f"Contact ID: [yellow]{contact_id}[/yellow]\n")
                 
                 # Display history table
-                from rich.table import Table
                 table = Table(show_header=True, header_style="bold cyan")
                 table.add_column("#", width=3)
                 table.add_column("Date/Time", width=16)
@@ -2492,12 +2839,16 @@ class VStudioCLI:
         if confirm == 'YES':
             try:
                 # Update database
-                success = self.db_manager.update_contact(contact_id, {field: old_value})
+                success = self._update_contact(contact_id, {field: old_value})
                 if success:
                     # Update current record if it's the same contact
                     if (self.data and self.current_index < len(self.data) and 
                         self.data[self.current_index].get('external_row_id') == contact_id):
                         self.data[self.current_index][field] = old_value
+                        self._display_cache.pop(id(self.data[self.current_index]), None)
+                    
+                    self._invalidate_stats()
+                    self._invalidate_month_events()
                     
                     # Save revert action to history  
                     self._save_edit_history(contact_id, field, history_entry['new_value'], old_value)
@@ -2528,6 +2879,10 @@ class VStudioCLI:
             self.console.print("[red]No contact ID found[/red]")
             return
         
+        if current_status == STATUS_CLOSE_WON:
+            self.console.print("[yellow]Contact is already a client[/yellow]")
+            return
+        
         # Confirm promotion
         name = record.get('name', 'Unknown')
         company = record.get('company', 'Unknown Company')
@@ -2545,8 +2900,9 @@ class VStudioCLI:
                 self._save_edit_history(contact_id, 'status', current_status, STATUS_CLOSE_WON)
                 
                 # Update database
-                success = self.db_manager.update_contact(contact_id, {'status': STATUS_CLOSE_WON})
+                success = self._update_contact(contact_id, {'status': STATUS_CLOSE_WON})
                 if success:
+                    self._invalidate_stats()
                     # Update current record
                     record['status'] = STATUS_CLOSE_WON
                     
@@ -2578,6 +2934,10 @@ class VStudioCLI:
             self.console.print("[red]No contact ID found[/red]")
             return
         
+        if current_status == STATUS_CLOSE_LOST:
+            self.console.print("[yellow]Contact is already in the cemetery[/yellow]")
+            return
+        
         # Confirm demotion
         name = record.get('name', 'Unknown')
         company = record.get('company', 'Unknown Company')
@@ -2595,8 +2955,9 @@ class VStudioCLI:
                 self._save_edit_history(contact_id, 'status', current_status, STATUS_CLOSE_LOST)
                 
                 # Update database
-                success = self.db_manager.update_contact(contact_id, {'status': STATUS_CLOSE_LOST})
+                success = self._update_contact(contact_id, {'status': STATUS_CLOSE_LOST})
                 if success:
+                    self._invalidate_stats()
                     # Update current record
                     record['status'] = STATUS_CLOSE_LOST
                     
@@ -2666,6 +3027,7 @@ class VStudioCLI:
             
             options_table.add_row("s", "Start Working", "Return to contact processing")
             options_table.add_row("n", "Create New Contact", "Add a new contact to the database")
+            options_table.add_row("m", "Add Multiple Contacts", "Quick-enter several contacts, saved in one write")
             options_table.add_row("v", "View Contacts", "Browse all contacts")
             options_table.add_row("l", "Calendar View", "Interactive monthly calendar with events")
             options_table.add_row("c", "View Clients", "Show successful deals")
@@ -2685,6 +3047,8 @@ class VStudioCLI:
                 return
             elif choice == 'n':
                 self._create_new_contact()
+            elif choice == 'm':
+                self._create_multiple_contacts()
             elif choice == 'v':
                 self._switch_view('all')
                 return
@@ -2704,7 +3068,8 @@ class VStudioCLI:
                 self._switch_view('overdue')
                 return
             elif choice == 'r':
-                continue  # Refresh by looping
+                self._invalidate_stats()  # Otherwise the loop would redraw the cached counts
+                continue
             elif choice == 'b':
                 return
             else:
@@ -2756,22 +3121,13 @@ class VStudioCLI:
         
         status_choice = self.console.input("[cyan]Choose status (1-3, default 1)[/cyan]: ").strip()
         
-        status_map = {
-            '1': STATUS_NEW,
-            '2': STATUS_CALLBACK,
-            '3': STATUS_MEETING_BOOKED,
-            '': STATUS_NEW  # Default
-        }
-        
-        contact_data['status'] = status_map.get(status_choice, STATUS_NEW)
+        contact_data['status'] = NEW_CONTACT_STATUSES.get(status_choice, STATUS_NEW)
         
         # Initial notes
         contact_data['notes'] = self.console.input("[dim cyan]Initial Notes[/dim cyan]: ").strip() or ""
         
         # Generate unique external ID
-        import uuid
-        import time
-        contact_data['external_row_id'] = f"manual_{int(time.time())}_{str(uuid.uuid4())[:8]}"
+        contact_data['external_row_id'] = self._new_external_row_id()
         
         # Callback/meeting dates if applicable
         if contact_data['status'] == STATUS_CALLBACK:
@@ -2807,19 +3163,21 @@ class VStudioCLI:
             try:
                 # Add to database
                 if self.db_manager.add_contact(contact_data):
+                    self._invalidate_stats()
+                    self._invalidate_month_events()
                     self.console.print(f"\n[bold green]✅ Contact '{contact_data['name']}' created successfully![/bold green]")
                     self.console.print(f"[dim]Contact ID: {contact_data['external_row_id']}[/dim]")
                     
                     # Ask if user wants to start working on this contact
                     work_now = self.console.input("\n[cyan]Switch to this contact now? (y/N)[/cyan]: ").strip().lower()
                     if work_now in ['y', 'yes']:
-                        # Reload all contacts and find the new one
-                        self._switch_view('all')
-                        # Find the new contact in the data
-                        for i, contact in enumerate(self.data):
-                            if contact.get('external_row_id') == contact_data['external_row_id']:
-                                self.current_index = i
-                                break
+                        if self.current_view == 'all' and self.data:
+                            # Already showing every contact: add the new one in memory instead of reloading
+                            self.data.append({field: contact_data.get(field, '') for field in CSV_SHAPE_FIELDS})
+                            self._id_to_index[contact_data['external_row_id']] = len(self.data) - 1
+                        else:
+                            self._switch_view('all')
+                        self.current_index = self._id_to_index.get(contact_data['external_row_id'], self.current_index)
                         return  # Exit dashboard to work on contact
                         
                 else:
@@ -2833,6 +3191,64 @@ class VStudioCLI:
         
         self.console.input("\nPress Enter to continue...")
     
+    def _create_multiple_contacts(self):
+        """Quick-enter several contacts and store them with a single bulk write."""
+        self.console.clear()
+        
+        self.console.print("[bold cyan]📝 Add Multiple Contacts[/bold cyan]")
+        self.console.print("=" * 50)
+        self.console.print("[dim]Enter name, phone and company for each contact. Leave the name empty to finish.[/dim]")
+        
+        contacts = []
+        while True:
+            self.console.print(f"\n[bold yellow]Contact #{len(contacts) + 1}[/bold yellow]")
+            name = self.console.input("[cyan]Name[/cyan]: ").strip()
+            if not name:
+                break
+            
+            phone_number = self.console.input("[cyan]Phone Number[/cyan]: ").strip()
+            if not phone_number:
+                self.console.print("[red]Phone number is required - contact skipped[/red]")
+                continue
+            
+            contacts.append({
+                'external_row_id': self._new_external_row_id(),
+                'name': name,
+                'phone_number': phone_number,
+                'company': self.console.input("[dim cyan]Company[/dim cyan]: ").strip(),
+                'email': '',
+                'title': '',
+                'address': '',
+                'city': '',
+                'source': 'manual_entry',
+                'status': STATUS_NEW,
+                'notes': ''
+            })
+        
+        if not contacts:
+            self.console.print("\n[yellow]No contacts entered[/yellow]")
+        else:
+            confirm = self.console.input(f"\n[bold green]Create these {len(contacts)} contacts? (y/N)[/bold green]: ").strip().lower()
+            
+            if confirm in ['y', 'yes']:
+                added = self.db_manager.add_contacts_bulk(contacts)
+                if added:
+                    self._invalidate_stats()
+                    self._invalidate_month_events()
+                
+                if added == len(contacts):
+                    self.console.print(f"\n[bold green]✅ {added} contacts created successfully![/bold green]")
+                else:
+                    self.console.print(f"\n[yellow]⚠️  Created {added} of {len(contacts)} contacts (see logs for rejected entries)[/yellow]")
+            else:
+                self.console.print("\n[yellow]Contact creation cancelled[/yellow]")
+        
+        self.console.input("\nPress Enter to continue...")
+    
+    def _new_external_row_id(self) -> str:
+        """Generate a unique external_row_id for a manually created contact."""
+        return f"manual_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+    
     def _show_welcome_dashboard(self) -> str:
         """Show welcome dashboard with CRM overview."""
         self.console.clear()
@@ -2875,107 +3291,112 @@ class VStudioCLI:
         
         # Menu options
         self.console.print("\n[bold cyan]📋 Quick Actions[/bold cyan]")
-        options_table = Table(show_header=False, box=None, padding=(0, 2))
-        options_table.add_column("Key", style="bold cyan", width=5)
-        options_table.add_column("Action", style="bold", width=25)
-        options_table.add_column("Description", style="dim")
-        
-        options_table.add_row("s", "Start Working", "Begin processing contacts")
-        options_table.add_row("c", "Calendar View", "View today's schedule and overdue items")
-        options_table.add_row("d", "Go to Overdue", "Jump directly to overdue items")
-        options_table.add_row("t", "Go to Today", "Jump to today's scheduled items")
-        options_table.add_row("n", "Go to New", "Start with new contacts")
-        options_table.add_row("q", "Quit", "Exit the application")
-        
-        self.console.print(options_table)
+        self.console.print(self._get_options_table())
         
         # Get user choice
         while True:
             choice = self.console.input("\n[bold cyan]Choose an action[/bold cyan] → ").strip().lower()
             
             if choice in ['s', 'c', 'd', 't', 'n', 'q']:
-                if choice in ['d', 't', 'n']:
+                if choice in DASHBOARD_VIEW_SHORTCUTS:
                     # Switch to the appropriate view
-                    view_map = {'d': 'overdue', 't': 'today', 'n': 'new'}
-                    self._switch_view(view_map[choice])
+                    self._switch_view(DASHBOARD_VIEW_SHORTCUTS[choice])
                     choice = 's'  # Then start working
                 return choice
             else:
                 self.console.print("[yellow]Please choose s, c, d, t, n, or q[/yellow]")
     
+    def _get_options_table(self) -> Table:
+        """Return the dashboard quick actions table, building it on first use."""
+        if self._options_table is None:
+            options_table = Table(show_header=False, box=None, padding=(0, 2))
+            options_table.add_column("Key", style="bold cyan", width=5)
+            options_table.add_column("Action", style="bold", width=25)
+            options_table.add_column("Description", style="dim")
+            
+            options_table.add_row("s", "Start Working", "Begin processing contacts")
+            options_table.add_row("c", "Calendar View", "View today's schedule and overdue items")
+            options_table.add_row("d", "Go to Overdue", "Jump directly to overdue items")
+            options_table.add_row("t", "Go to Today", "Jump to today's scheduled items")
+            options_table.add_row("n", "Go to New", "Start with new contacts")
+            options_table.add_row("q", "Quit", "Exit the application")
+            self._options_table = options_table
+        
+        return self._options_table
+    
     def _get_crm_statistics(self) -> Dict[str, int]:
-        """Get CRM statistics for the dashboard."""
+        """Get CRM statistics for the dashboard, reusing them for up to _stats_ttl seconds."""
+        now = time.monotonic()
+        if (self._stats_cache and now - self._stats_cache[0] < self._stats_ttl and
+                self._stats_cache[1] == self.testing_mode):
+            return self._stats_cache[2]
+        
+        stats = self._compute_crm_statistics()
+        self._stats_cache = (now, self.testing_mode, stats)
+        return stats
+    
+    def _invalidate_stats(self):
+        """Drop cached dashboard statistics after a contact mutation."""
+        self._stats_cache = None
+    
+    def _compute_crm_statistics(self) -> Dict[str, int]:
+        """Compute CRM statistics for the dashboard."""
         if not self.db_manager:
             return {'total': len(self.data), 'today': 0, 'overdue': 0, 'new': 0, 'recent': 0}
         
+        self._drain_writes()
+        
+        # MongoDB keeps the status counters materialized; date-dependent counts are read live
+        stats = self.db_manager.get_crm_stats()
+        if stats:
+            return stats
+        
         try:
-            # Get counts from database views
-            today_contacts = self.db_manager.get_priority_view_data("today")
-            overdue_contacts = self.db_manager.get_priority_view_data("overdue")
-            new_contacts = self.db_manager.get_priority_view_data("new")
-            all_contacts = self.db_manager.get_contacts()
-            
-            # Count recent activity (no-answer in last 7 days)
-            recent_count = 0
-            for contact in all_contacts:
-                if (contact.get('status') == 'no_answer' and 
-                    contact.get('last_call_at')):
-                    try:
-                        last_call = datetime.fromisoformat(contact['last_call_at'].replace('Z', '+00:00'))
-                        if (datetime.now() - last_call).days <= 7:
-                            recent_count += 1
-                    except:
-                        pass
-            
-            # Get clients and cemetery counts
-            clients = self.db_manager.get_contacts_by_status(STATUS_CLOSE_WON)
-            cemetery = self.db_manager.get_contacts_by_status(STATUS_CLOSE_LOST)
-            
-            return {
-                'total': len(all_contacts),
-                'today': len(today_contacts),
-                'overdue': len(overdue_contacts), 
-                'new': len(new_contacts),
-                'recent': recent_count,
-                'clients': len(clients),
-                'cemetery': len(cemetery)
-            }
+            # CSV backend (or crm_stats unavailable): count every category directly
+            return self.db_manager.get_stats_counts()
         except Exception as e:
             self.logger.error(f"Failed to get CRM statistics: {e}")
             return {'total': len(self.data), 'today': 0, 'overdue': 0, 'new': 0, 'recent': 0}
     
     def _show_calendar_view(self):
         """Show interactive monthly calendar grid with events."""
-        import calendar
-        
         # Start with current month
         current_date = datetime.now()
         viewing_month = current_date.month
         viewing_year = current_date.year
         
+        month_events = {}
+        loaded_month = None  # (year, month) that month_events belongs to
+        redraw = True
+        
         while True:
-            self.console.clear()
-            
-            # Create calendar header
-            month_name = calendar.month_name[viewing_month]
-            calendar_header = Panel.fit(
-                f"[bold blue]📅 {month_name} {viewing_year}[/bold blue]",
-                style="bright_blue"
-            )
-            self.console.print(calendar_header)
-            
-            # Get events for this month
-            month_events = self._get_month_events(viewing_year, viewing_month)
-            
-            # Create the calendar grid
-            self._render_calendar_grid(viewing_year, viewing_month, month_events, current_date)
-            
-            # Show event legend
-            self._show_calendar_legend()
-            
-            # Show controls
-            self.console.print("\n[bold cyan]Navigation:[/bold cyan]")
-            self.console.print("[cyan]◄ p[/cyan] Previous Month  [cyan]► n[/cyan] Next Month  [cyan]t[/cyan] Today  [cyan]d[/cyan] Show Day Details  [cyan]q[/cyan] Quit")
+            # Only repaint (and refetch) when the view state actually changed
+            if redraw:
+                self.console.clear()
+                
+                # Create calendar header
+                month_name = calendar.month_name[viewing_month]
+                calendar_header = Panel.fit(
+                    f"[bold blue]📅 {month_name} {viewing_year}[/bold blue]",
+                    style="bright_blue"
+                )
+                self.console.print(calendar_header)
+                
+                # Get events for this month
+                if loaded_month != (viewing_year, viewing_month):
+                    month_events = self._get_month_events(viewing_year, viewing_month)
+                    loaded_month = (viewing_year, viewing_month)
+                
+                # Create the calendar grid
+                self._render_calendar_grid(viewing_year, viewing_month, month_events, current_date)
+                
+                # Show event legend
+                self._show_calendar_legend()
+                
+                # Show controls
+                self.console.print("\n[bold cyan]Navigation:[/bold cyan]")
+                self.console.print("[cyan]◄ p[/cyan] Previous Month  [cyan]► n[/cyan] Next Month  [cyan]t[/cyan] Today  [cyan]d[/cyan] Show Day Details  [cyan]q[/cyan] Quit")
+            redraw = True
             
             # Get user input
             action = self.console.input("\n[bold]Action → [/bold]").strip().lower()
@@ -3007,63 +3428,101 @@ class VStudioCLI:
                     day = int(day_input)
                     if 1 <= day <= 31:
                         self._show_day_details(viewing_year, viewing_month, day, month_events)
+                        loaded_month = None  # Outcomes recorded there may have moved events
                     else:
                         self.console.print("[red]Invalid day number[/red]")
-                        self.console.input("Press Enter to continue...")
+                        redraw = False
                 except ValueError:
                     self.console.print("[red]Please enter a valid number[/red]")
-                    self.console.input("Press Enter to continue...")
+                    redraw = False
+            else:
+                self.console.print("[yellow]Unknown command[/yellow]")
+                redraw = False
     
-    def _get_month_events(self, year: int, month: int) -> Dict[int, List]:
-        """Get all events for a specific month."""
+    def _get_month_events(self, year: int, month: int) -> Dict[int, List[EventRecord]]:
+        """Get all events for a specific month, reusing them for up to MONTH_EVENTS_CACHE_TTL seconds."""
         if not self.db_manager:
             return {}
         
-        # Get all contacts with scheduled activities
-        all_contacts = self.db_manager.get_contacts()
+        now = time.monotonic()
+        cached = self._month_events_cache.get((year, month))
+        if cached and now - cached[0] < MONTH_EVENTS_CACHE_TTL:
+            return cached[1]
+        
+        month_events = self._load_month_events(year, month)
+        self._month_events_cache[(year, month)] = (now, month_events)
+        return month_events
+    
+    def _invalidate_month_events(self):
+        """Drop cached calendar months after a callback, meeting or contact change."""
+        self._month_events_cache.clear()
+    
+    def _load_month_events(self, year: int, month: int) -> Dict[int, List[EventRecord]]:
+        """Query and group all events for a specific month."""
+        self._drain_writes()  # Outcomes may still be queued for the database
+        
+        # Only contacts with a callback or meeting in this month
+        start = datetime(year, month, 1)
+        end = datetime(year + month // 12, month % 12 + 1, 1)
+        month_contacts = self.db_manager.get_events_in_range(start, end)
         month_events = {}
+        today = date.today()
         
-        for contact in all_contacts:
+        for contact in month_contacts:
             # Check for callbacks
             if contact.get('callback_on'):
                 try:
-                    callback_date = datetime.fromisoformat(contact['callback_on']).date()
+                    callback_date = _to_datetime(contact['callback_on']).date()
                     if callback_date.year == year and callback_date.month == month:
                         day = callback_date.day
                         if day not in month_events:
                             month_events[day] = []
-                        month_events[day].append({
-                            'type': 'callback',
-                            'contact': contact,
-                            'time': '10:00 AM',  # Default callback time
-                            'date': callback_date
-                        })
+                        month_events[day].append(EventRecord(
+                            type='callback',
+                            contact=contact,
+                            time='10:00 AM',  # Default callback time
+                            date=callback_date,
+                            is_overdue=callback_date < today
+                        ))
                 except:
                     pass
             
             # Check for meetings
             if contact.get('meeting_at'):
                 try:
-                    meeting_datetime = datetime.fromisoformat(contact['meeting_at'])
+                    meeting_datetime = _to_datetime(contact['meeting_at'])
                     meeting_date = meeting_datetime.date()
                     if meeting_date.year == year and meeting_date.month == month:
                         day = meeting_date.day
                         if day not in month_events:
                             month_events[day] = []
-                        month_events[day].append({
-                            'type': 'meeting',
-                            'contact': contact,
-                            'time': meeting_datetime.strftime('%I:%M %p'),
-                            'date': meeting_date
-                        })
+                        month_events[day].append(EventRecord(
+                            type='meeting',
+                            contact=contact,
+                            time=meeting_datetime.strftime('%I:%M %p'),
+                            date=meeting_date,
+                            is_overdue=meeting_date < today
+                        ))
                 except:
                     pass
         
+        # Sort each day once: meetings first by time, then callbacks
+        for day_events in month_events.values():
+            day_events.sort(key=lambda x: (
+                x.type == 'callback',  # Callbacks come after meetings
+                x.time
+            ))
+        
         return month_events
     
     def _render_calendar_grid(self, year: int, month: int, events: Dict, current_date: datetime):
         """Render the monthly calendar grid."""
-        import calendar
+        # Reuse the grid while the month, its events and today's date are unchanged
+        today = current_date.date()
+        cached = self._calendar_table
+        if cached and cached[:3] == (year, month, today) and cached[3] is events:
+            self.console.print(cached[4])
+            return
         
         # Create calendar
         cal = calendar.monthcalendar(year, month)
@@ -3077,7 +3536,6 @@ class VStudioCLI:
             calendar_table.add_column(day_name, justify="center", width=12)
         
         # Add rows for each week
-        today = current_date.date()
         current_month_today = (today.year == year and today.month == month)
         
         for week in cal:
@@ -3099,7 +3557,7 @@ class VStudioCLI:
                         event_count = len(events[day])
                         if event_count == 1:
                             event = events[day][0]
-                            if event['type'] == 'callback':
+                            if event.type == 'callback':
                                 cell_content += "\n[yellow]○ CB[/yellow]"
                             else:
                                 cell_content += "\n[green]● MT[/green]"
@@ -3107,15 +3565,15 @@ class VStudioCLI:
                             # Multiple events
                             cell_content += f"\n[cyan]◆ {event_count}[/cyan]"
                         
-                        # Check if any events are overdue
-                        event_date = datetime(year, month, day).date()
-                        if event_date < today:
+                        # Check if any events are overdue (tagged in _get_month_events)
+                        if any(event.is_overdue for event in events[day]):
                             cell_content = f"[red]{cell_content}[/red]"
                     
                     week_cells.append(cell_content)
             
             calendar_table.add_row(*week_cells)
         
+        self._calendar_table = (year, month, today, events, calendar_table)
         self.console.print(calendar_table)
     
     def _show_calendar_legend(self):
@@ -3126,99 +3584,105 @@ class VStudioCLI:
     
     def _show_day_details(self, year: int, month: int, day: int, events: Dict):
         """Show detailed view of a specific day's events with contact access."""
+        redraw = True
         while True:
-            self.console.clear()
-            
             try:
                 selected_date = datetime(year, month, day).date()
-                day_name = selected_date.strftime('%A')
-                date_str = selected_date.strftime('%B %d, %Y')
-                
-                header = Panel.fit(
-                    f"[bold green]📅 {day_name}, {date_str}[/bold green]",
-                    style="bright_green"
-                )
-                self.console.print(header)
+                day_events = events.get(day)  # Already ordered by _get_month_events
                 
-                if day in events:
-                    # Show events for this day with numbers
-                    events_table = Table(show_header=True, header_style="bold green")
-                    events_table.add_column("#", width=3)
-                    events_table.add_column("Time", width=12)
-                    events_table.add_column("Type", width=12)
-                    events_table.add_column("Contact", width=25)
-                    events_table.add_column("Company", width=25)
-                    events_table.add_column("Phone", width=15)
-                    
-                    # Sort events by time (meetings first by actual time, then callbacks)
-                    day_events = sorted(events[day], key=lambda x: (
-                        x['type'] == 'callback',  # Callbacks come after meetings
-                        x.get('time', '10:00 AM')
-                    ))
-                    
-                    # Add numbered rows
-                    for i, event in enumerate(day_events, 1):
-                        contact = event['contact']
-                        event_type = "[green]Meeting[/green]" if event['type'] == 'meeting' else "[yellow]Callback[/yellow]"
-                        
-                        # Check if overdue
-                        today = datetime.now().date()
-                        if selected_date < today:
-                            event_type = f"[red]{event_type} (OVERDUE)[/red]"
-                        
-                        events_table.add_row(
-                            str(i),
-                            event['time'],
-                            event_type,
-                            contact.get('name', 'Unknown')[:25],
-                            contact.get('company', 'N/A')[:25],
-                            contact.get('phone_number', 'N/A')
-                        )
-                    
-                    self.console.print(events_table)
-                    
-                    # Show summary and options
-                    callback_count = sum(1 for e in day_events if e['type'] == 'callback')
-                    meeting_count = sum(1 for e in day_events if e['type'] == 'meeting')
-                    
-                    self.console.print(f"\n[bold cyan]Summary:[/bold cyan] {meeting_count} meetings, {callback_count} callbacks")
-                    
-                    # Show contact access options
-                    self.console.print(f"\n[bold cyan]Actions:[/bold cyan]")
-                    self.console.print(f"[cyan]1-{len(day_events)}[/cyan] Work on Contact  [cyan]b[/cyan] Back to Calendar")
-                    
-                    action = self.console.input("\n[bold]Select contact or action → [/bold]").strip().lower()
-                    
-                    if action == 'b':
-                        break
-                    elif action.isdigit():
-                        contact_num = int(action)
-                        if 1 <= contact_num <= len(day_events):
-                            selected_event = day_events[contact_num - 1]
-                            result = self._work_on_calendar_contact(selected_event, selected_date)
-                            if result == 'calendar':
-                                break  # Return to calendar
-                            # Otherwise stay in day details
-                        else:
-                            self.console.print(f"[red]Please enter a number between 1 and {len(day_events)}[/red]")
-                            self.console.input("Press Enter to continue...")
-                    else:
-                        self.console.print("[red]Invalid selection[/red]")
-                        self.console.input("Press Enter to continue...")
+                # Invalid input only adds an error line; keep the screen as it is
+                if redraw:
+                    self.console.clear()
+                    self._print_day_details(selected_date, day_events)
+                redraw = True
                 
-                else:
-                    self.console.print("[dim]No events scheduled for this day[/dim]")
+                if not day_events:
                     self.console.input("\n[dim]Press Enter to return to calendar...[/dim]")
                     break
                 
+                action = self.console.input("\n[bold]Select contact or action → [/bold]").strip().lower()
+                
+                if action == 'b':
+                    break
+                elif action.isdigit():
+                    contact_num = int(action)
+                    if 1 <= contact_num <= len(day_events):
+                        selected_event = day_events[contact_num - 1]
+                        result = self._work_on_calendar_contact(selected_event, selected_date)
+                        if result == 'calendar':
+                            break  # Return to calendar
+                        # Otherwise stay in day details
+                    else:
+                        self.console.print(f"[red]Please enter a number between 1 and {len(day_events)}[/red]")
+                        redraw = False
+                else:
+                    self.console.print("[red]Invalid selection[/red]")
+                    redraw = False
+                
             except ValueError:
                 self.console.print("[red]Invalid date[/red]")
                 self.console.input("Press Enter to continue...")
                 break
     
-    def _work_on_calendar_contact(self, event: Dict, event_date: date) -> str:
+    def _print_day_details(self, selected_date: date, day_events: Optional[List[EventRecord]]):
+        """Print the day header, its numbered events table and the available actions."""
+        day_name = selected_date.strftime('%A')
+        date_str = selected_date.strftime('%B %d, %Y')
+        
+        header = Panel.fit(
+            f"[bold green]📅 {day_name}, {date_str}[/bold green]",
+            style="bright_green"
+        )
+        self.console.print(header)
+        
+        if not day_events:
+            self.console.print("[dim]No events scheduled for this day[/dim]")
+            return
+        
+        # Show events for this day with numbers
+        events_table = Table(show_header=True, header_style="bold green")
+        events_table.add_column("#", width=3)
+        events_table.add_column("Time", width=12)
+        events_table.add_column("Type", width=12)
+        events_table.add_column("Contact", width=25, no_wrap=True, overflow="ellipsis")
+        events_table.add_column("Company", width=25, no_wrap=True, overflow="ellipsis")
+        events_table.add_column("Phone", width=15, no_wrap=True, overflow="ellipsis")
+        
+        # Check if overdue
+        overdue = selected_date < datetime.now().date()
+        
+        # Add numbered rows
+        for i, event in enumerate(day_events, 1):
+            contact = event.contact
+            event_type = "[green]Meeting[/green]" if event.type == 'meeting' else "[yellow]Callback[/yellow]"
+            
+            if overdue:
+                event_type = f"[red]{event_type} (OVERDUE)[/red]"
+            
+            events_table.add_row(
+                str(i),
+                event.time,
+                event_type,
+                contact.get('name', 'Unknown'),
+                contact.get('company', 'N/A'),
+                contact.get('phone_number', 'N/A')
+            )
+        
+        self.console.print(events_table)
+        
+        # Show summary and options
+        callback_count = sum(1 for e in day_events if e.type == 'callback')
+        meeting_count = sum(1 for e in day_events if e.type == 'meeting')
+        
+        self.console.print(f"\n[bold cyan]Summary:[/bold cyan] {meeting_count} meetings, {callback_count} callbacks")
+        
+        # Show contact access options
+        self.console.print(f"\n[bold cyan]Actions:[/bold cyan]")
+        self.console.print(f"[cyan]1-{len(day_events)}[/cyan] Work on Contact  [cyan]b[/cyan] Back to Calendar")
+    
+    def _work_on_calendar_contact(self, event: EventRecord, event_date: date) -> str:
         """Work on a specific contact selected from calendar. Returns 'calendar' to return to calendar."""
-        contact = event['contact']
+        contact = event.contact
         
         # Set up the contact as current record
         original_data = self.data
@@ -3229,34 +3693,38 @@ class VStudioCLI:
             self.data = [contact]
             self.current_index = 0
             
+            # Calendar context doesn't change while working on the contact
+            event_type = event.type.title()
+            event_time = event.time
+            date_str = event_date.strftime('%B %d, %Y')
+            
+            # Check if overdue
+            today = datetime.now().date()
+            overdue_text = ""
+            if event_date < today:
+                days_overdue = (today - event_date).days
+                overdue_text = f" - [red]OVERDUE by {days_overdue} day{'s' if days_overdue != 1 else ''}[/red]"
+            
+            calendar_context = Panel.fit(
+                f"[bold blue]📅 Calendar Context: {event_type} on {date_str} at {event_time}{overdue_text}[/bold blue]",
+                style="blue"
+            )
+            
+            redraw = True
             while True:
-                self.console.clear()
-                
-                # Show contact details with calendar context
-                event_type = event['type'].title()
-                event_time = event['time']
-                date_str = event_date.strftime('%B %d, %Y')
-                
-                # Check if overdue
-                today = datetime.now().date()
-                overdue_text = ""
-                if event_date < today:
-                    days_overdue = (today - event_date).days
-                    overdue_text = f" - [red]OVERDUE by {days_overdue} day{'s' if days_overdue != 1 else ''}[/red]"
-                
-                calendar_context = Panel.fit(
-                    f"[bold blue]📅 Calendar Context: {event_type} on {date_str} at {event_time}{overdue_text}[/bold blue]",
-                    style="blue"
-                )
-                self.console.print(calendar_context)
-                
-                # Display the contact using existing display logic
-                self._display_record()
-                
-                # Show calendar-specific commands
-                self.console.print(f"\n[bold cyan]Calendar Actions:[/bold cyan]")
-                self.console.print("[cyan]1[/cyan] Call  [cyan]2[/cyan] Text  [cyan]5[/cyan] Add Note  [cyan]o[/cyan] Mark Outcome")
-                self.console.print("[cyan]c[/cyan] Return to Calendar  [cyan]d[/cyan] Return to Day Details")
+                # Unknown commands only add an error line; keep the screen as it is
+                if redraw:
+                    self.console.clear()
+                    self.console.print(calendar_context)
+                    
+                    # Display the contact using existing display logic
+                    self._display_record()
+                    
+                    # Show calendar-specific commands
+                    self.console.print(f"\n[bold cyan]Calendar Actions:[/bold cyan]")
+                    self.console.print("[cyan]1[/cyan] Call  [cyan]2[/cyan] Text  [cyan]5[/cyan] Add Note  [cyan]o[/cyan] Mark Outcome")
+                    self.console.print("[cyan]c[/cyan] Return to Calendar  [cyan]d[/cyan] Return to Day Details")
+                redraw = True
                 
                 action = self.console.input("\n[bold]Action → [/bold]").strip().lower()
                 
@@ -3278,7 +3746,7 @@ class VStudioCLI:
                     self._handle_call_outcome('manual')
                 else:
                     self.console.print("[yellow]Unknown command[/yellow]")
-                    self.console.input("Press Enter to continue...")
+                    redraw = False
                 
         finally:
             # Restore original data and index
@@ -3290,6 +3758,14 @@ class VStudioCLI:
         if self.current_call_id and self.api_client:
             self.api_client.terminate_call(self.current_call_id)
         
+        # Stop the periodic flush and write out anything still buffered
+        if self._flush_timer:
+            self._flush_timer.cancel()
+        try:
+            self._flush_all()
+        except Exception as e:
+            self.logger.error(f"Failed to flush pending writes: {e}")
+        
         # Close database connection
         if self.db_manager:
             self.db_manager.close()
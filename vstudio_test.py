@@ -6,14 +6,126 @@ This is identical to vstudio_cli.py but uses the test database.
 
 import sys
 import os
-import json
-from pathlib import Path
 
-# Import the main VStudio CLI
-from vstudio_cli import VStudioCLI
+__version__ = "1.0"
+
+# Static copy of the argparse help, printed for -h/--help without building the parser
+HELP_TEXT = """usage: vstudio_test.py [-h] [-v] [-d] [-V] [--daemon] [--send COMMAND]
+                       [csv_file]
+
+VStudio CLI (TEST MODE) - MongoDB CRM backend with test data
+
+positional arguments:
+  csv_file        CSV file (optional - will use test database)
+
+options:
+  -h, --help      show this help message and exit
+  -v, --verbose   Verbose logging
+  -d, --debug     Debug mode
+  -V, --version   show program's version number and exit
+  --daemon        Serve commands on /tmp/vstudio-test.sock with a warm
+                  database connection
+  --send COMMAND  Send a command (ping, stats, count <status>) to a running
+                  daemon
+
+This version uses the test database (vstudio_crm_test) with enriched test data."""
+
+BANNER = "🧪 VStudio CLI - TEST MODE\nUsing test database: vstudio_crm_test\n" + "=" * 50 + "\n"
+
+# Database settings for test mode (same keys as database_config.json)
+TEST_CONFIG = {
+    "use_mongodb": True,
+    "mongodb_uri": "mongodb://localhost:27017/",
+    "database_name": "vstudio_crm_test",  # Test database
+    "csv_backup_enabled": True,
+    "auto_migrate": False
+}
+
+# Unix socket for --daemon mode and its one-line commands
+DAEMON_SOCKET = "/tmp/vstudio-test.sock"
+DAEMON_CLIENT_TIMEOUT = 5  # Seconds a client may take to send its command before it is dropped
+DAEMON_REPLY_TIMEOUT = 30  # Seconds --send waits for the daemon to connect and answer
+
+def serve_daemon(socket_path: str = DAEMON_SOCKET):
+    """Keep one test-database connection warm and answer one-line commands on a Unix socket.
+    
+    Commands: ping, stats, count <status>. Each connection gets a single-line JSON reply.
+    """
+    import json
+    import socket
+    from database import CRMDataManager, DatabaseConfig, apply_config_settings
+    
+    # A socket file may belong to a running daemon or be left behind by one that died
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except FileNotFoundError:
+            pass
+        except ConnectionRefusedError:
+            os.unlink(socket_path)  # Stale: nothing is listening on it
+        else:
+            print(f"vstudio-test daemon already running on {socket_path}")
+            return
+    
+    db_manager = CRMDataManager(apply_config_settings(DatabaseConfig(), TEST_CONFIG))
+    commands = {
+        "ping": lambda arg: "pong",
+        "stats": lambda arg: db_manager.get_stats_counts(),
+        "count": lambda arg: db_manager.count_contacts(status_filter=arg or None),
+    }
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    os.chmod(socket_path, 0o600)  # Only our user may query the test database
+    server.listen()
+    print(f"vstudio-test daemon listening on {socket_path}")
+    
+    try:
+        while True:
+            conn, _ = server.accept()
+            conn.settimeout(DAEMON_CLIENT_TIMEOUT)  # A silent client must not block everyone else
+            try:
+                with conn, conn.makefile('rw', encoding='utf-8') as stream:
+                    name, _, arg = stream.readline().strip().partition(' ')
+                    handler = commands.get(name)
+                    try:
+                        reply = {"ok": True, "result": handler(arg)} if handler else {"ok": False, "error": f"unknown command: {name}"}
+                    except Exception as e:
+                        reply = {"ok": False, "error": str(e)}
+                    stream.write(json.dumps(reply, default=str) + "\n")
+            except OSError:
+                pass  # Client timed out or hung up; serve the next one
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        try:
+            os.unlink(socket_path)
+        except FileNotFoundError:
+            pass
+        db_manager.close()
+
+def send_command(command: str, socket_path: str = DAEMON_SOCKET) -> str:
+    """Send one command to a running daemon and return its JSON reply line."""
+    import socket
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(DAEMON_REPLY_TIMEOUT)
+        client.connect(socket_path)
+        with client.makefile('rw', encoding='utf-8') as stream:
+            stream.write(command + "\n")
+            stream.flush()
+            return stream.readline().strip()
 
 def main():
     """Main entry point for test version."""
+    if sys.argv[1:] in (['-h'], ['--help']):
+        print(HELP_TEXT)
+        return
+    if sys.argv[1:2] in (['-V'], ['--version']):
+        print(f"vstudio-test {__version__}")
+        return
+    
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -23,51 +135,39 @@ def main():
     parser.add_argument("csv_file", nargs="?", help="CSV file (optional - will use test database)")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose logging")
     parser.add_argument("-d", "--debug", action="store_true", help="Debug mode")
+    parser.add_argument("-V", "--version", action="version", version=f"vstudio-test {__version__}")
+    parser.add_argument("--daemon", action="store_true", help=f"Serve commands on {DAEMON_SOCKET} with a warm database connection")
+    parser.add_argument("--send", metavar="COMMAND", help="Send a command (ping, stats, count <status>) to a running daemon")
     
     args = parser.parse_args()
     
+    if args.send:
+        try:
+            print(send_command(args.send))
+        except OSError as e:
+            print(f"vstudio-test daemon not running on {DAEMON_SOCKET} ({e}); start it with --daemon", file=sys.stderr)
+            sys.exit(1)
+        return
+    
     if args.verbose:
         import logging
         logging.getLogger().setLevel(logging.DEBUG)
     
-    # Override database config to use test database
-    test_config = {
-        "use_mongodb": True,
-        "mongodb_uri": "mongodb://localhost:27017/",
-        "database_name": "vstudio_crm_test",  # Test database
-        "csv_backup_enabled": True,
-        "auto_migrate": False
-    }
-    
-    # Write temporary config for test mode
-    original_config_path = Path("database_config.json")
-    backup_config_path = Path("database_config.json.backup")
-    temp_config_path = Path("database_config.json")
-    
-    # Backup original config if it exists
-    if original_config_path.exists():
-        import shutil
-        shutil.copy2(original_config_path, backup_config_path)
+    sys.stdout.write(BANNER)
     
-    # Write test config
-    with open(temp_config_path, 'w') as f:
-        json.dump(test_config, f, indent=2)
+    if args.daemon:
+        serve_daemon()
+        return
     
-    print("🧪 VStudio CLI - TEST MODE")
-    print("Using test database: vstudio_crm_test")
-    print("=" * 50)
+    # Import the main VStudio CLI only now, so --help and usage errors stay fast
+    from vstudio_cli import VStudioCLI
     
+    # The test config is passed in memory; database_config.json is never touched
     try:
-        app = VStudioCLI(debug=args.debug)
+        app = VStudioCLI(debug=args.debug, config_override=TEST_CONFIG)
         app.run(args.csv_file)
     finally:
-        # Restore original config
-        if backup_config_path.exists():
-            backup_config_path.rename(original_config_path)
-        elif temp_config_path.exists():
-            temp_config_path.unlink()  # Remove test config if no original existed
-        
-        print("\n👋 Test session ended - original config restored")
+        sys.stdout.write("\n👋 Test session ended\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file